@@ -138,17 +138,23 @@ def demonstrate_file_watching():
     print("请在 15 秒内手动修改该文件中的 `app_name` 字段并保存，观察下面的输出。")
 
     try:
-        # watch_interval 设置为 1.0 秒，以便快速响应变更
+        # 未安装 watchdog 时按 watch_interval 轮询文件，设置为 1.0 秒以便快速响应变更
         with NexusConfigManager.with_file(base_path="examples/resources", watch_interval=1.0) as manager:
             manager.register(AppConfig)
             
             print("\n--- 开始监听 (持续 15 秒) ---")
-            for i in range(15):
-                app_config = manager.get_config(AppConfig)
-                # 使用 \r 实现单行刷新
-                print(f"\r[{i+1:2d}/15s] 当前应用名称: {app_config.app_name}          ", end="")
-                time.sleep(1)
-            print("\n--- 监听结束 ---\n")
+            print(f"当前应用名称: {manager.get_config(AppConfig).app_name}")
+            
+            # 阻塞等待变更通知，而不是每秒轮询一次
+            deadline = time.monotonic() + 15
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if manager.wait_for_change(timeout=remaining):
+                    app_config = manager.get_config(AppConfig)
+                    print(f"🔄 检测到变更，当前应用名称: {app_config.app_name}")
+            print("--- 监听结束 ---\n")
             
     except Exception as e:
         print(f"❌ 实时更新演示失败: {e}")
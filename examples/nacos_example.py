@@ -130,14 +130,18 @@ def main():
             # --- 4. 演示配置动态更新 ---
             print("\n--- 动态更新演示 (持续 15 秒) ---")
             print("现在您可以尝试在 Nacos 控制台修改上述任一配置的值。")
-            print("脚本将每秒检查一次更新。")
+            print("脚本会在配置更新时立即输出最新值。")
             
-            for i in range(15):
-                json_ver = manager.get_config(NacosJsonConfig).version
-                yaml_host = manager.get_config(NacosYamlConfig).server.host
-                print(f"\r[{i+1:2d}/15s] 当前值: JSON version='{json_ver}', YAML host='{yaml_host}'          ", end="")
-                time.sleep(1)
-            print("\n--- 监听结束 ---\n")
+            deadline = time.monotonic() + 15
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if manager.wait_for_change(timeout=remaining):
+                    json_ver = manager.get_config(NacosJsonConfig).version
+                    yaml_host = manager.get_config(NacosYamlConfig).server.host
+                    print(f"🔄 检测到变更: JSON version='{json_ver}', YAML host='{yaml_host}'")
+            print("--- 监听结束 ---\n")
 
     except Exception as e:
         print(f"\n❌ 发生严重错误: {e}")
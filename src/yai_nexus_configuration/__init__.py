@@ -37,21 +37,58 @@ __version__ = "0.1.0"
 __author__ = "YAI Team"
 __email__ = "team@yai.com"
 
-# 导出核心组件
-from .manager import NexusConfigManager
-from .config import NexusConfig
-from .decorator import nexus_config
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# 公共组件按需导入（PEP 562），避免 `import yai_nexus_configuration`
+# 时就加载 Pydantic、PyYAML 等依赖
+_LAZY_IMPORTS = {
+    # 核心组件
+    "NexusConfigManager": ".manager",
+    "NexusConfigManagerAsync": ".async_manager",
+    "NexusConfig": ".config",
+    "nexus_config": ".decorator",
+    # 异常类
+    "NexusConfigError": ".exceptions",
+    "ProviderError": ".exceptions",
+    "ConfigNotRegisteredError": ".exceptions",
+    "ConfigValidationError": ".exceptions",
+    "ProviderConnectionError": ".exceptions",
+    "ConfigSourceError": ".exceptions",
+    "MissingConfigMetadataError": ".exceptions",
+}
+
+if TYPE_CHECKING:
+    from .manager import NexusConfigManager
+    from .async_manager import NexusConfigManagerAsync
+    from .config import NexusConfig
+    from .decorator import nexus_config
+    from .exceptions import (
+        NexusConfigError,
+        ProviderError,
+        ConfigNotRegisteredError,
+        ConfigValidationError,
+        ProviderConnectionError,
+        ConfigSourceError,
+        MissingConfigMetadataError,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """首次访问公共组件时再导入对应模块"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# 导出异常类
-from .exceptions import (
-    NexusConfigError,
-    ProviderError,
-    ConfigNotRegisteredError,
-    ConfigValidationError,
-    ProviderConnectionError,
-    ConfigSourceError,
-    MissingConfigMetadataError,
-)
 
 # 公共 API
 __all__ = [
@@ -60,6 +97,7 @@ __all__ = [
     
     # 核心组件
     "NexusConfigManager",
+    "NexusConfigManagerAsync",
     "NexusConfig",
     
     # Decorators
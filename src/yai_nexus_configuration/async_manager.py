@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YAI Nexus Configuration - 异步管理器
+
+NexusConfigManagerAsync 为 asyncio 应用（如 FastAPI 启动阶段）提供异步 API。
+从配置源获取内容时不阻塞事件循环，也不持有线程锁，多个配置可以并发注册；
+解析、验证和开始监听等同步步骤在线程池中执行。
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Type, TypeVar, Dict, Any, Iterable, Mapping, Optional, Union, List
+
+from .manager import NexusConfigManager
+from .decorator import get_config_metadata
+from .exceptions import ConfigNotRegisteredError, MissingConfigMetadataError, ProviderConnectionError
+from .internal.providers import AbstractProvider
+
+T = TypeVar("T")
+logger = logging.getLogger(__name__)
+
+
+class NexusConfigManagerAsync:
+    """
+    异步配置管理器
+
+    内部复用 NexusConfigManager 完成解析、验证、存储和变更监听，
+    从配置源获取内容的步骤改为通过 `aget_config` 异步执行，其余步骤在线程池中执行。
+
+    Example:
+        >>> manager = NexusConfigManagerAsync.with_nacos("localhost:8848")
+        >>> await manager.register_many([DatabaseConfig, RedisConfig])
+        >>> db_config = manager.get_config(DatabaseConfig)
+    """
+
+    def __init__(self, manager: NexusConfigManager):
+        """
+        初始化异步管理器
+
+        Note: 通常不直接调用此方法，而是使用工厂方法如 with_nacos()
+
+        Args:
+            manager: 底层的同步管理器
+        """
+        self._manager = manager
+        # 每个配置类一把 asyncio 锁，避免同一配置被并发地重复获取
+        self._locks: Dict[Type, asyncio.Lock] = {}
+        # 由同步管理器的变更监听器通过 call_soon_threadsafe 置位，供 wait_for_change 使用。
+        # 需要绑定事件循环，因此在首次注册或等待时才创建
+        self._change_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def with_nacos(
+        cls,
+        server_addresses: Union[str, List[str]],
+        namespace: str = "",
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        trust_reload: bool = False,
+        **kwargs: Any
+    ) -> "NexusConfigManagerAsync":
+        """
+        使用 Nacos 作为配置源创建异步管理器，参数与 `NexusConfigManager.with_nacos` 相同
+        """
+        return cls(NexusConfigManager.with_nacos(
+            server_addresses,
+            namespace=namespace,
+            username=username,
+            password=password,
+            trust_reload=trust_reload,
+            **kwargs
+        ))
+
+    @classmethod
+    def with_file(
+        cls,
+        base_path: Union[str, Path] = "configs",
+        default_format: str = "json",
+        watch_interval: float = 1.0,
+        auto_create_dirs: bool = True,
+        trust_reload: bool = False,
+        debounce_interval: float = 0.1
+    ) -> "NexusConfigManagerAsync":
+        """
+        使用本地文件作为配置源创建异步管理器，参数与 `NexusConfigManager.with_file` 相同
+        """
+        return cls(NexusConfigManager.with_file(
+            base_path=base_path,
+            default_format=default_format,
+            watch_interval=watch_interval,
+            auto_create_dirs=auto_create_dirs,
+            trust_reload=trust_reload,
+            debounce_interval=debounce_interval
+        ))
+
+    def _lock(self, config_class: Type) -> asyncio.Lock:
+        """获取（必要时创建）指定配置类的 asyncio 锁"""
+        lock = self._locks.get(config_class)
+        if lock is None:
+            lock = self._locks[config_class] = asyncio.Lock()
+        return lock
+
+    def _provider(self) -> AbstractProvider:
+        """获取底层管理器的配置提供者，未配置时抛出异常"""
+        provider = self._manager.provider
+        if provider is None:
+            raise ProviderConnectionError("NexusConfigManagerAsync", "管理器未配置 Provider")
+        return provider
+
+    def _ensure_change_event(self) -> asyncio.Event:
+        """创建变更事件，并让同步管理器在配置更新或关闭时从其他线程置位它"""
+        if self._change_event is None:
+            self._loop = asyncio.get_running_loop()
+            self._change_event = asyncio.Event()
+            self._manager.add_change_listener(self._on_manager_change)
+        return self._change_event
+
+    def _on_manager_change(self) -> None:
+        """同步管理器的变更监听器，在 Provider 监听线程或关闭线程中调用"""
+        loop, event = self._loop, self._change_event
+        if loop is None or event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # 事件循环已关闭
+            pass
+
+    async def register(self, config_class: Type[T]) -> None:
+        """
+        异步注册配置类
+        
+        获取配置内容通过 `aget_config` 异步执行，解析、验证和开始监听
+        在线程池中执行，都不会阻塞事件循环。
+
+        Args:
+            config_class: 被 @nexus_config 装饰的配置类
+
+        Raises:
+            MissingConfigMetadataError: 如果配置类缺少必要的元数据
+            ConfigValidationError: 如果配置数据验证失败
+        """
+        metadata = get_config_metadata(config_class)
+        if not metadata:
+            raise MissingConfigMetadataError(config_class, "nexus_config")
+
+        self._ensure_change_event()
+        async with self._lock(config_class):
+            if self._manager.is_registered(config_class):
+                logger.warning(f"配置类 {config_class.__name__} 已经注册，跳过")
+                return
+
+            raw_config = await self._provider().aget_config(
+                metadata['data_id'], metadata['group']
+            )
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, self._manager.register_with_content, config_class, raw_config
+            )
+
+    async def register_many(self, config_classes: Iterable[Type]) -> None:
+        """
+        并发地批量注册配置类
+
+        先校验所有配置类的元数据，任一配置类缺少元数据时不会注册其中任何一个。
+
+        Args:
+            config_classes: 被 @nexus_config 装饰的配置类集合
+
+        Raises:
+            MissingConfigMetadataError: 如果某个配置类缺少必要的元数据
+            ConfigValidationError: 如果配置数据验证失败
+        """
+        config_classes = list(config_classes)
+        for config_class in config_classes:
+            if not get_config_metadata(config_class):
+                raise MissingConfigMetadataError(config_class, "nexus_config")
+
+        await asyncio.gather(*(self.register(config_class) for config_class in config_classes))
+
+    async def reload_config(self, config_class: Type[T]) -> T:
+        """
+        异步重新加载指定配置
+
+        Args:
+            config_class: 配置类型
+
+        Returns:
+            更新后的配置实例
+        """
+        async with self._lock(config_class):
+            if not self._manager.is_registered(config_class):
+                raise ConfigNotRegisteredError(config_class)
+
+            metadata = get_config_metadata(config_class)
+            try:
+                raw_config = await self._provider().aget_config(
+                    metadata['data_id'], metadata['group']
+                )
+            except Exception as e:
+                logger.error(f"重新加载配置失败: {config_class.__name__}, 错误: {e}")
+                raise
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._manager.reload_with_content, config_class, raw_config
+            )
+
+    def get_config(self, config_class: Type[T]) -> T:
+        """
+        获取配置实例（只读取内存中的配置，无需等待）
+
+        Raises:
+            ConfigNotRegisteredError: 如果配置未注册
+        """
+        return self._manager.get_config(config_class)
+
+    async def unregister(self, config_class: Type[T]) -> bool:
+        """
+        取消注册配置类
+
+        Returns:
+            True 如果成功取消注册，False 如果配置未注册
+        """
+        async with self._lock(config_class):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._manager.unregister, config_class)
+
+    def get_all_configs(self) -> Mapping[str, Any]:
+        """获取所有已注册的配置实例"""
+        return self._manager.get_all_configs()
+
+    def get_manager_info(self) -> Dict[str, Any]:
+        """获取管理器状态信息"""
+        return self._manager.get_manager_info()
+
+    async def wait_for_change(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待任一已注册配置因配置源变更而更新，等待期间不阻塞事件循环
+
+        变更通知通过 asyncio.Event 传递，不占用线程池线程，取消等待不会遗留后台线程。
+        管理器关闭时会唤醒所有等待者，关闭之后的调用立即返回。
+
+        Args:
+            timeout: 最长等待时间（秒），None 表示一直等待
+
+        Returns:
+            True 如果在超时前有配置被更新；超时或管理器已关闭时返回 False
+        """
+        if self._manager.closed:
+            return False
+        event = self._ensure_change_event()
+        if not event.is_set():
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        if self._manager.closed:
+            return False
+        event.clear()
+        return True
+
+    async def close(self) -> None:
+        """关闭管理器，断开连接并清理资源。此操作是幂等的。"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._manager.close)
+        self._manager.remove_change_listener(self._on_manager_change)
+        if self._change_event is not None:
+            # 唤醒等待者（同一事件循环中关闭时无需经过 call_soon_threadsafe）
+            self._change_event.set()
+        self._locks.clear()
+
+    async def __aenter__(self):
+        """异步上下文管理器支持"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器支持"""
+        await self.close()
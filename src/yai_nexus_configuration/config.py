@@ -8,8 +8,38 @@ YAI Nexus Configuration - 配置模型模块
 该模块基于 Pydantic，为用户提供一个结构清晰、支持数据验证的配置声明方式。
 """
 
+import re
+import weakref
 from pydantic import BaseModel, ConfigDict
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet
+
+
+# 敏感字段关键词（不区分大小写），'key' 同时覆盖了 'api_key' 等字段
+_SENSITIVE_FIELD_PATTERN = re.compile(r'password|token|secret|key', re.IGNORECASE)
+
+
+# 可以直接引用、无需序列化的字段值类型
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+# 配置类 -> 定义了 field_serializer 的字段名。弱引用配置类，动态创建的配置类不会因缓存而无法回收
+_custom_serialized_fields_cache: "weakref.WeakKeyDictionary[type, FrozenSet[str]]" = weakref.WeakKeyDictionary()
+
+
+def _custom_serialized_fields(config_class: type) -> FrozenSet[str]:
+    """获取配置类中定义了 field_serializer 的字段名（`'*'` 表示全部字段），结果按配置类缓存"""
+    cached = _custom_serialized_fields_cache.get(config_class)
+    if cached is not None:
+        return cached
+    fields = frozenset(
+        field_name
+        for serializer in config_class.__pydantic_decorators__.field_serializers.values()
+        for field_name in serializer.info.fields
+    )
+    if '*' in fields:
+        fields = frozenset(config_class.model_fields)
+    _custom_serialized_fields_cache[config_class] = fields
+    return fields
 
 
 class NexusConfig(BaseModel):
@@ -24,6 +54,7 @@ class NexusConfig(BaseModel):
       - **丰富的字段类型**: 支持包括嵌套模型、列表、枚举在内的多种复杂类型。
       - **默认值**: 可以为字段提供默认值。
       - **易于集成**: 可轻松与 JSON 或字典等数据格式互相转换。
+      - **不可变**: 实例加载后只读，配置变更时由管理器整体替换为新实例。
 
     用法示例:
         >>> from yai_nexus_configuration import NexusConfig, nexus_config
@@ -44,8 +75,8 @@ class NexusConfig(BaseModel):
     
     # Pydantic V2+ Style Configuration
     model_config = ConfigDict(
-        # 在对字段重新赋值时进行数据验证
-        validate_assignment=True,
+        # 配置实例只读：禁止字段赋值，省去赋值验证开销，并使实例可哈希
+        frozen=True,
         # 序列化枚举时使用枚举的值而不是其名称
         use_enum_values=True
     )
@@ -66,16 +97,43 @@ class NexusConfig(BaseModel):
         此方法会屏蔽名称中包含 'password', 'token', 'secret' 等
         关键词的字段值，适用于日志记录和调试场景。
         
+        摘要包含的键与 `model_dump()` 相同：排除 `exclude=True` 的字段，包含额外字段和计算字段。
+        字符串、数字等标量值直接引用实例中的值，其余值（嵌套模型、列表、字典、计算字段等）
+        交给 Pydantic 序列化，结果可以直接 JSON 序列化。
+        
         Returns:
             一个包含配置摘要的字典，敏感字段的值被替换为 '***hidden***'。
         """
-        data = self.model_dump()
+        data: Dict[str, Any] = {}
+        serialized_fields = set()
+        custom_serialized = _custom_serialized_fields(type(self))
         
-        # 定义需要隐藏的敏感字段关键词
-        sensitive_fields = {'password', 'token', 'secret', 'key', 'api_key'}
+        fields = [
+            (field_name, getattr(self, field_name))
+            for field_name, field in type(self).model_fields.items()
+            if not field.exclude
+        ]
+        if self.model_extra:
+            fields.extend(self.model_extra.items())
         
-        for field_name in list(data.keys()):
-            if any(sensitive in field_name.lower() for sensitive in sensitive_fields):
+        for field_name, value in fields:
+            if _SENSITIVE_FIELD_PATTERN.search(field_name):
                 data[field_name] = "***hidden***"
+            elif isinstance(value, _SCALAR_TYPES) and field_name not in custom_serialized:
+                data[field_name] = value
+            else:
+                # 先占位以保持字段顺序，稍后一次性序列化
+                data[field_name] = None
+                serialized_fields.add(field_name)
+        
+        for field_name in type(self).model_computed_fields:
+            if _SENSITIVE_FIELD_PATTERN.search(field_name):
+                data[field_name] = "***hidden***"
+            else:
+                data[field_name] = None
+                serialized_fields.add(field_name)
+        
+        if serialized_fields:
+            data.update(self.model_dump(include=serialized_fields))
                 
         return data
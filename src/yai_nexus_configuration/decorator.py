@@ -8,7 +8,7 @@ YAI Nexus Configuration Decorator
 这些元数据将被 `NexusConfigManager` 用来从配置源（如 Nacos 或本地文件）获取正确的配置。
 """
 
-import functools
+import sys
 from typing import Type, Optional
 
 from .config import NexusConfig
@@ -42,9 +42,10 @@ def nexus_config(
             raise TypeError("The decorated class must be a subclass of NexusConfig.")
 
         # 将元数据附加到类本身
+        # data_id/group 会作为 Provider 内部字典键反复使用，驻留后比较只需判断指针
         setattr(cls, '__nexus_config__', {
-            'data_id': data_id,
-            'group': group,
+            'data_id': sys.intern(data_id),
+            'group': sys.intern(group),
             'auto_refresh': auto_refresh
         })
         
@@ -56,6 +57,9 @@ def get_config_metadata(config_class: Type) -> Optional[dict]:
     """
     从配置类中提取元数据
     
+    元数据直接保存在类属性上，读取只需一次属性查找，无需额外缓存
+    （按类缓存还会让动态创建的配置类无法被回收）。
+    
     Args:
         config_class: 被装饰的配置类
         
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YAI Nexus Configuration - JSON 工具模块
+
+优先使用 orjson 进行 JSON 的解析与序列化；未安装时解析依次回退到 ujson、
+标准库 json，序列化回退到标准库 json。
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+    ujson = None
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，捕获此异常即可覆盖两种实现
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(content: Union[str, bytes]) -> Any:
+    """
+    解析 JSON 内容
+    
+    Args:
+        content: JSON 字符串或 UTF-8 字节串
+        
+    Returns:
+        解析后的 Python 对象
+        
+    Raises:
+        JSONDecodeError: 内容不是合法的 JSON 时抛出
+    """
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    if HAS_UJSON:
+        try:
+            return ujson.loads(content)
+        except ValueError as e:
+            # 统一转换为 JSONDecodeError，调用方只需捕获一种异常
+            if isinstance(content, bytes):
+                content = content.decode("utf-8", errors="replace")
+            raise JSONDecodeError(str(e), content, 0) from None
+    return json.loads(content)
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """
+    将对象序列化为 JSON 字符串（非 ASCII 字符保持原样）
+    
+    Args:
+        data: 要序列化的对象
+        indent: 是否使用 2 空格缩进输出
+        
+    Returns:
+        JSON 字符串
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
@@ -7,12 +7,17 @@ YAI Nexus Configuration - Provider 抽象基类
 定义了配置提供者的标准接口，所有具体的 Provider 实现都必须继承此类。
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# 监听器键: (group, data_id)
+WatcherKey = Tuple[str, str]
+
 
 class AbstractProvider(ABC):
     """
@@ -33,7 +38,7 @@ class AbstractProvider(ABC):
         """
         self.name = name
         self._connected = False
-        self._watchers: Dict[str, Callable[[str], None]] = {}
+        self._watchers: Dict[WatcherKey, Callable[[str], None]] = {}
     
     @abstractmethod
     def connect(self) -> None:
@@ -67,6 +72,57 @@ class AbstractProvider(ABC):
         """
         pass
     
+    async def aget_config(self, data_id: str, group: str) -> str:
+        """
+        异步获取配置数据
+        
+        默认实现在线程池中执行 get_config，不阻塞事件循环。
+        
+        Args:
+            data_id: 配置 ID
+            group: 配置组
+            
+        Returns:
+            配置数据的原始字符串
+            
+        Raises:
+            ConfigSourceError: 获取配置失败时抛出
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_config, data_id, group)
+    
+    def get_configs(self, items: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """
+        批量获取配置数据
+        
+        默认实现依次调用 get_config，子类可以覆盖以减少往返次数。
+        
+        Args:
+            items: (data_id, group) 列表
+            
+        Returns:
+            (data_id, group) 到配置原始字符串的映射
+            
+        Raises:
+            ConfigSourceError: 任一配置获取失败时抛出
+        """
+        return {(data_id, group): self.get_config(data_id, group) for data_id, group in items}
+    
+    def resolve_data_id(self, data_id: str, group: str) -> str:
+        """
+        获取配置实际对应的 data_id，管理器根据其扩展名选择解析器
+        
+        默认原样返回，子类可以覆盖（如 FileProvider 为不带扩展名的 data_id 补上实际文件的扩展名）。
+        
+        Args:
+            data_id: 配置 ID
+            group: 配置组
+            
+        Returns:
+            用于选择解析器的 data_id
+        """
+        return data_id
+    
     @abstractmethod
     def watch_config(self, data_id: str, group: str, callback: Callable[[str], None]) -> None:
         """
@@ -112,17 +168,21 @@ class AbstractProvider(ABC):
             'watchers_count': len(self._watchers)
         }
     
-    def _register_watcher(self, key: str, callback: Callable[[str], None]) -> None:
+    def _register_watcher(self, key: WatcherKey, callback: Callable[[str], None]) -> None:
         """注册监听器（供子类使用）"""
         self._watchers[key] = callback
-        logger.debug(f"注册配置监听器: {key}")
+        logger.debug("注册配置监听器: %s", key)
     
-    def _unregister_watcher(self, key: str) -> None:
+    def _unregister_watcher(self, key: WatcherKey) -> None:
         """取消注册监听器（供子类使用）"""
         if key in self._watchers:
             del self._watchers[key]
-            logger.debug(f"取消配置监听器: {key}")
+            logger.debug("取消配置监听器: %s", key)
     
-    def _get_watcher_key(self, data_id: str, group: str) -> str:
-        """生成监听器的唯一键"""
-        return f"{group}::{data_id}"
+    def _get_watcher_key(self, data_id: str, group: str) -> WatcherKey:
+        """
+        生成监听器的唯一键
+        
+        使用驻留字符串组成的元组，无需拼接字符串，哈希和比较也更快。
+        """
+        return (sys.intern(group), sys.intern(data_id))
@@ -7,25 +7,106 @@ YAI Nexus Configuration - File Provider
 本地文件配置提供者，支持从 JSON/YAML 文件读取配置并监听文件变更。
 """
 
-import json
+import functools
+import importlib.util
 import logging
 import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Optional, Union
-from threading import Thread, Event
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+from threading import Thread, Event, Lock, Timer, current_thread
 
-from .base import AbstractProvider
+from .base import AbstractProvider, WatcherKey
+from .. import json_utils
+from ..utils import content_fingerprint
 from ...exceptions import ProviderConnectionError, ConfigSourceError
 
 logger = logging.getLogger(__name__)
 
-try:
+# data_id 无扩展名时，默认格式的扩展名之后的探测顺序：
+# JSON 的解析速度远快于 YAML，其余扩展名中优先使用 JSON
+_CONFIG_FILE_SUFFIXES = ('.json', '.yaml', '.yml')
+
+# 可选依赖只在实际使用时才导入，这里仅检测是否已安装
+HAS_YAML = importlib.util.find_spec("yaml") is not None
+HAS_WATCHDOG = importlib.util.find_spec("watchdog") is not None
+
+# 文件事件通知在这些网络文件系统上不可靠，需要改用轮询
+_NETWORK_FS_TYPES = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "9p"})
+_MOUNTS_FILE = "/proc/self/mounts"
+_MOUNT_ESCAPE_PATTERN = re.compile(rb"\\([0-7]{3})")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml_dumper():
+    """
+    获取 YAML 安全输出器（首次调用时才导入 PyYAML）
+    
+    优先使用基于 libyaml 的 C 实现，未编译 libyaml 时回退到纯 Python 实现。
+    """
     import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-    yaml = None
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _read_text(path: Union[str, Path]) -> str:
+    """
+    读取整个文件并返回去除首尾空白的文本
+    
+    配置文件通常很小：无缓冲的二进制读取按文件大小一次分配即可读完，
+    再整体解码，省去文本模式 IO 栈逐块解码的开销。
+    """
+    with open(path, 'rb', buffering=0) as f:
+        return f.read().decode('utf-8').strip()
+
+
+def _is_network_filesystem(path: Path) -> bool:
+    """
+    判断路径是否位于网络文件系统上（依据 /proc/self/mounts，仅 Linux 可用）
+    
+    无法判断时返回 False。
+    """
+    try:
+        with open(_MOUNTS_FILE, "rb") as f:
+            mounts = f.read().splitlines()
+        
+        target = os.path.realpath(path)
+        best_match, best_fs_type = "", ""
+        for line in mounts:
+            fields = line.split()
+            if len(fields) < 3:
+                continue
+            # 挂载点中的空格等字符以八进制转义，如 \040；其余字节按文件系统编码还原
+            mount_point = os.fsdecode(
+                _MOUNT_ESCAPE_PATTERN.sub(lambda m: bytes([int(m.group(1), 8)]), fields[1])
+            )
+            if mount_point != "/" and not (target == mount_point or target.startswith(mount_point + os.sep)):
+                continue
+            if len(mount_point) >= len(best_match):
+                best_match, best_fs_type = mount_point, os.fsdecode(fields[2])
+    except (OSError, ValueError) as e:
+        logger.debug("无法读取挂载信息: %s", e)
+        return False
+    
+    return best_fs_type in _NETWORK_FS_TYPES
+
+
+class _ConfigFileEventHandler:
+    """将 watchdog 文件系统事件转发给 FileProvider"""
+    
+    def __init__(self, provider: "FileProvider"):
+        self._provider = provider
+    
+    def dispatch(self, event) -> None:
+        """watchdog 观察者线程调用的事件入口"""
+        if event.is_directory:
+            return
+        
+        if event.event_type in ("modified", "created"):
+            self._provider._on_file_event(event.src_path)
+        elif event.event_type == "moved":
+            self._provider._on_file_event(event.dest_path)
 
 
 class FileProvider(AbstractProvider):
@@ -34,6 +115,11 @@ class FileProvider(AbstractProvider):
     
     支持从本地 JSON 和 YAML 文件读取配置，并可以监听文件变更。
     文件路径模式: {base_path}/{group}/{data_id}
+    
+    安装 watchdog 后使用操作系统的文件事件通知（inotify/FSEvents/
+    ReadDirectoryChangesW）监听变更，只监听被监听文件所在的目录（不递归），
+    其他目录中的文件变化不会产生事件；未安装 watchdog、指定 use_polling 或
+    配置目录位于网络文件系统时，按 watch_interval 轮询文件状态。
     """
     
     def __init__(
@@ -41,7 +127,9 @@ class FileProvider(AbstractProvider):
         base_path: Union[str, Path] = "configs",
         default_format: str = "json",
         watch_interval: float = 1.0,
-        auto_create_dirs: bool = True
+        auto_create_dirs: bool = True,
+        use_polling: bool = False,
+        debounce_interval: float = 0.1
     ):
         """
         初始化文件 Provider
@@ -49,8 +137,12 @@ class FileProvider(AbstractProvider):
         Args:
             base_path: 配置文件的基础目录路径
             default_format: 默认文件格式 ('json' 或 'yaml')
-            watch_interval: 文件变更监听间隔（秒）
+            watch_interval: 文件变更轮询间隔（秒），仅在使用轮询时生效
             auto_create_dirs: 是否自动创建目录
+            use_polling: 是否强制使用轮询监听。配置目录位于 NFS/CIFS 等网络文件系统时
+                会自动改用轮询
+            debounce_interval: 文件事件的合并窗口（秒）。编辑器保存一次文件通常会产生多个事件，
+                窗口内同一文件的事件只触发一次检查；小于等于 0 时不合并
         """
         super().__init__("File")
         
@@ -58,12 +150,38 @@ class FileProvider(AbstractProvider):
         self.default_format = default_format.lower()
         self.watch_interval = watch_interval
         self.auto_create_dirs = auto_create_dirs
+        self.use_polling = use_polling
+        self.debounce_interval = debounce_interval
         
         # 文件监听相关
         self._watching = False
         self._watch_thread: Optional[Thread] = None
         self._stop_event = Event()
-        self._file_mtimes: Dict[str, float] = {}
+        self._observer = None
+        # watchdog 已订阅的目录: 目录绝对路径 -> (ObservedWatch, 是否递归)
+        self._observed_dirs: Dict[str, Tuple[Any, bool]] = {}
+        self._observed_lock = Lock()
+        # 等待触发的延迟检查: 监听器键 -> Timer
+        self._pending_checks: Dict[WatcherKey, Timer] = {}
+        self._pending_lock = Lock()
+        # 执行变更回调的工作线程。只用一个线程：同一文件的回调按检测顺序执行，
+        # 监听线程也不会因下游的解析和验证而阻塞
+        self._callback_executor: Optional[ThreadPoolExecutor] = None
+        # 被监听文件的状态: 路径 -> (st_mtime_ns, st_size, 内容指纹)
+        # mtime/size 用于发现变更，内容指纹用于过滤内容未变化的修改事件；
+        # 文件被删除时 mtime/size 置为 None，保留指纹
+        self._file_state: Dict[str, Tuple[Optional[int], Optional[int], Optional[Hashable]]] = {}
+        # 被监听文件的绝对路径 -> (监听器键, 路径字符串)
+        self._watched_paths: Dict[str, Tuple[WatcherKey, str]] = {}
+        # _watched_paths 条目的只读快照，仅在监听/取消监听时重建（写时复制），
+        # 轮询线程直接遍历，无需每次复制，也无需拆分监听器键、解析路径
+        self._watched_entries: Tuple[Tuple[WatcherKey, str], ...] = ()
+        
+        # 已解析的配置文件路径: (data_id, group) -> Path
+        self._resolved_paths: Dict[Tuple[str, str], Path] = {}
+        
+        # 文件内容缓存: 路径 -> (st_mtime_ns, st_size, 内容)
+        self._content_cache: Dict[str, Tuple[int, int, str]] = {}
         
         # 验证参数
         if self.default_format not in ['json', 'yaml']:
@@ -71,6 +189,12 @@ class FileProvider(AbstractProvider):
         
         if self.default_format == 'yaml' and not HAS_YAML:
             raise ImportError("使用 YAML 格式需要安装 PyYAML: pip install PyYAML")
+        
+        # data_id 无扩展名时的探测顺序：默认格式优先，其余按 _CONFIG_FILE_SUFFIXES
+        default_suffix = f".{self.default_format}"
+        self._probe_suffixes = (default_suffix,) + tuple(
+            suffix for suffix in _CONFIG_FILE_SUFFIXES if suffix != default_suffix
+        )
     
     def connect(self) -> None:
         """
@@ -99,6 +223,10 @@ class FileProvider(AbstractProvider):
                 )
             
             # 启动文件监听
+            if self._callback_executor is None:
+                self._callback_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="nexus-cfg-cb"
+                )
             self._start_file_watching()
             
             self._set_connected(True)
@@ -115,9 +243,21 @@ class FileProvider(AbstractProvider):
         self._stop_file_watching()
         self._set_connected(False)
         self._watchers.clear()
-        self._file_mtimes.clear()
+        if self._callback_executor is not None:
+            # 尚未执行的回调会因监听器已移除而被跳过
+            self._callback_executor.shutdown(wait=False)
+            self._callback_executor = None
+        self._file_state.clear()
+        self._watched_paths.clear()
+        self._watched_entries = ()
+        self._resolved_paths.clear()
+        self.clear_cache()
         logger.info("已断开文件系统连接")
     
+    def clear_cache(self) -> None:
+        """清空文件内容缓存"""
+        self._content_cache.clear()
+    
     def get_config(self, data_id: str, group: str) -> str:
         """
         从文件获取配置数据
@@ -138,15 +278,14 @@ class FileProvider(AbstractProvider):
         try:
             file_path = self._get_config_file_path(data_id, group)
             
-            if not file_path.exists():
+            try:
+                content = self._read_config_file(file_path)
+            except FileNotFoundError:
                 raise ConfigSourceError(
                     data_id, group, "get_config",
                     f"配置文件不存在: {file_path}"
                 )
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            
             if not content:
                 raise ConfigSourceError(
                     data_id, group, "get_config",
@@ -156,7 +295,7 @@ class FileProvider(AbstractProvider):
             # 验证文件格式
             # self._validate_config_content(content, file_path)
             
-            logger.debug(f"成功读取配置文件: {file_path}")
+            logger.debug("成功读取配置文件: %s", file_path)
             return content
             
         except Exception as e:
@@ -180,11 +319,25 @@ class FileProvider(AbstractProvider):
         watcher_key = self._get_watcher_key(data_id, group)
         file_path = self._get_config_file_path(data_id, group)
         
-        # 记录初始修改时间
-        if file_path.exists():
-            self._file_mtimes[str(file_path)] = file_path.stat().st_mtime
+        path_str = str(file_path)
         
+        # 记录初始文件状态（一次 stat 同时完成存在性检查）
+        try:
+            stat = os.stat(path_str)
+        except FileNotFoundError:
+            pass
+        else:
+            try:
+                digest = content_fingerprint(self._read_config_file(path_str))
+            except (OSError, UnicodeDecodeError):
+                digest = None
+            self._file_state[path_str] = (stat.st_mtime_ns, stat.st_size, digest)
+        
+        abs_path = os.path.abspath(path_str)
+        self._watched_paths[abs_path] = (watcher_key, path_str)
+        self._watched_entries = tuple(self._watched_paths.values())
         self._register_watcher(watcher_key, callback)
+        self._observe_directory(os.path.dirname(abs_path))
         logger.info(f"开始监听配置文件变更: {file_path}")
     
     def unwatch_config(self, data_id: str, group: str) -> None:
@@ -196,19 +349,61 @@ class FileProvider(AbstractProvider):
             group: 配置组
         """
         watcher_key = self._get_watcher_key(data_id, group)
-        file_path = self._get_config_file_path(data_id, group)
         
-        # 移除修改时间记录
-        if str(file_path) in self._file_mtimes:
-            del self._file_mtimes[str(file_path)]
+        # 按监听器键查找被监听的路径：无扩展名的 data_id 在监听之后可能解析到其他文件
+        for abs_path, (key, file_path) in list(self._watched_paths.items()):
+            if key == watcher_key:
+                del self._watched_paths[abs_path]
+                # 移除文件状态记录和缓存的文件内容
+                self._file_state.pop(file_path, None)
+                self._content_cache.pop(file_path, None)
+                logger.info(f"停止监听配置文件变更: {file_path}")
+        self._watched_entries = tuple(self._watched_paths.values())
+        self._release_unused_directories()
+        # 不再使用的路径解析结果及其内容缓存一并移除，避免缓存随注册/取消注册无限增长
+        resolved_path = self._resolved_paths.pop((data_id, group), None)
+        if resolved_path is not None:
+            self._content_cache.pop(str(resolved_path), None)
         
+        self._cancel_pending_check(watcher_key)
         self._unregister_watcher(watcher_key)
-        logger.info(f"停止监听配置文件变更: {file_path}")
+    
+    def _read_config_file(self, file_path: Union[str, Path]) -> str:
+        """
+        读取配置文件内容
+        
+        以 (st_mtime_ns, st_size) 作为缓存键，文件未变更时直接返回缓存内容，
+        避免重复的文件读取和解码。
+        
+        Args:
+            file_path: 配置文件路径
+            
+        Returns:
+            去除首尾空白后的文件内容
+            
+        Raises:
+            FileNotFoundError: 文件不存在时抛出
+        """
+        cache_key = str(file_path)
+        stat = os.stat(cache_key)
+        
+        cached = self._content_cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        content = _read_text(cache_key)
+        
+        self._content_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, content)
+        return content
     
     def _get_config_file_path(self, data_id: str, group: str) -> Path:
         """
         获取配置文件的完整路径
         
+        data_id 没有扩展名时，先查找默认格式的文件，再依次查找 .json、.yaml、.yml 文件，
+        都不存在时使用默认格式的扩展名。只缓存指向已存在文件的解析结果，
+        以便之后新建的文件仍能被找到。
+        
         Args:
             data_id: 配置文件名
             group: 配置组
@@ -216,35 +411,140 @@ class FileProvider(AbstractProvider):
         Returns:
             配置文件的 Path 对象
         """
-        # 如果 data_id 没有扩展名，添加默认扩展名
-        if not Path(data_id).suffix:
-            data_id = f"{data_id}.{self.default_format}"
+        cache_key = (data_id, group)
+        file_path = self._resolved_paths.get(cache_key)
+        if file_path is not None:
+            return file_path
         
-        return self.base_path / group / data_id
+        group_dir = self.base_path / group
+        if Path(data_id).suffix:
+            file_path = group_dir / data_id
+        else:
+            for suffix in self._probe_suffixes:
+                candidate = group_dir / f"{data_id}{suffix}"
+                if candidate.is_file():
+                    file_path = candidate
+                    break
+            else:
+                # 没有已存在的文件，使用默认扩展名，且不缓存
+                return group_dir / f"{data_id}.{self.default_format}"
+        
+        self._resolved_paths[cache_key] = file_path
+        return file_path
+    
+    def resolve_data_id(self, data_id: str, group: str) -> str:
+        """
+        获取配置实际对应的文件名
+        
+        data_id 没有扩展名时，返回带上实际文件扩展名的 data_id，
+        管理器据此选择 JSON 或 YAML 解析器。
+        """
+        if Path(data_id).suffix:
+            return data_id
+        return data_id + self._get_config_file_path(data_id, group).suffix
     
     def _start_file_watching(self) -> None:
-        """启动文件变更监听线程"""
+        """启动文件变更监听（watchdog 事件通知，或轮询线程）"""
         if self._watching:
             return
         
         self._watching = True
+        
+        polling = self.use_polling or not HAS_WATCHDOG
+        if not polling and _is_network_filesystem(self.base_path):
+            logger.info(f"配置目录位于网络文件系统，改用轮询监听: {self.base_path}")
+            polling = True
+        
+        if not polling:
+            from watchdog.observers import Observer
+            
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+            for abs_path in list(self._watched_paths):
+                self._observe_directory(os.path.dirname(abs_path))
+            logger.debug("文件事件监听已启动 (watchdog)")
+            return
+        
         self._stop_event.clear()
         self._watch_thread = Thread(target=self._file_watch_loop, daemon=True)
         self._watch_thread.start()
         logger.debug("文件监听线程已启动")
     
     def _stop_file_watching(self) -> None:
-        """停止文件变更监听线程"""
+        """停止文件变更监听"""
         if not self._watching:
             return
         
         self._watching = False
+        
+        if self._observer is not None:
+            self._observer.stop()
+            if self._observer.is_alive():
+                self._observer.join(timeout=2.0)
+            self._observer = None
+            with self._observed_lock:
+                self._observed_dirs.clear()
+        
+        with self._pending_lock:
+            for timer in self._pending_checks.values():
+                timer.cancel()
+            self._pending_checks.clear()
+        
         self._stop_event.set()
         
         if self._watch_thread and self._watch_thread.is_alive():
             self._watch_thread.join(timeout=2.0)
         
-        logger.debug("文件监听线程已停止")
+        logger.debug("文件监听已停止")
+    
+    def _observe_directory(self, directory: str) -> None:
+        """
+        让 watchdog 订阅被监听文件所在的目录（仅在使用 watchdog 时生效）
+        
+        目录尚不存在时，递归订阅最近的已存在上级目录（不超出 base_path），
+        以便之后创建的目录和文件仍能被发现。
+        """
+        observer = self._observer
+        if observer is None:
+            return
+        
+        base = os.path.abspath(self.base_path)
+        target, recursive = directory, False
+        while not os.path.isdir(target) and target != base:
+            parent = os.path.dirname(target)
+            if parent == target:
+                break
+            target, recursive = parent, True
+        
+        with self._observed_lock:
+            observed = self._observed_dirs.get(target)
+            if observed is not None and (observed[1] or not recursive):
+                return
+            if observed is not None:
+                observer.unschedule(observed[0])
+            try:
+                watch = observer.schedule(_ConfigFileEventHandler(self), target, recursive=recursive)
+            except OSError as e:
+                logger.warning(f"无法监听配置目录: {target}, 错误: {e}")
+                return
+            self._observed_dirs[target] = (watch, recursive)
+    
+    def _release_unused_directories(self) -> None:
+        """取消订阅不再包含被监听文件的目录"""
+        observer = self._observer
+        if observer is None:
+            return
+        
+        watched_dirs = {os.path.dirname(abs_path) for abs_path in self._watched_paths}
+        with self._observed_lock:
+            for directory, (watch, recursive) in list(self._observed_dirs.items()):
+                if directory in watched_dirs:
+                    continue
+                if recursive and any(d.startswith(directory + os.sep) for d in watched_dirs):
+                    continue
+                observer.unschedule(watch)
+                del self._observed_dirs[directory]
     
     def _file_watch_loop(self) -> None:
         """文件变更监听循环"""
@@ -257,46 +557,115 @@ class FileProvider(AbstractProvider):
             # 等待下次检查
             self._stop_event.wait(self.watch_interval)
     
+    def _on_file_event(self, src_path: str) -> None:
+        """处理 watchdog 文件事件，只对被监听的文件触发检查"""
+        entry = self._watched_paths.get(os.path.abspath(src_path))
+        if entry is None:
+            return
+        
+        if self.debounce_interval <= 0:
+            self._check_file_change(*entry)
+            return
+        
+        # 重新计时：只有在窗口内没有新事件时才真正读取文件
+        watcher_key = entry[0]
+        with self._pending_lock:
+            timer = self._pending_checks.get(watcher_key)
+            if timer is not None:
+                timer.cancel()
+            timer = Timer(self.debounce_interval, self._run_pending_check, args=entry)
+            timer.daemon = True
+            self._pending_checks[watcher_key] = timer
+            timer.start()
+    
+    def _run_pending_check(self, watcher_key: WatcherKey, file_path: str) -> None:
+        """延迟检查到期，在 Timer 线程中执行"""
+        with self._pending_lock:
+            if self._pending_checks.get(watcher_key) is current_thread():
+                del self._pending_checks[watcher_key]
+        
+        if self._watching:
+            self._check_file_change(watcher_key, file_path)
+    
+    def _cancel_pending_check(self, watcher_key: WatcherKey) -> None:
+        """取消尚未触发的延迟检查"""
+        with self._pending_lock:
+            timer = self._pending_checks.pop(watcher_key, None)
+        if timer is not None:
+            timer.cancel()
+    
     def _check_file_changes(self) -> None:
         """检查文件变更并触发回调"""
-        # 创建 watcher 字典的副本进行迭代，以避免在迭代期间修改字典
-        for watcher_key, callback in list(self._watchers.items()):
-            group, data_id = watcher_key.split("::", 1)
-            file_path = self._get_config_file_path(data_id, group)
-            
-            # 检查文件是否存在
-            if not file_path.exists():
-                continue
-            
-            try:
-                current_mtime = file_path.stat().st_mtime
-                last_mtime = self._file_mtimes.get(str(file_path))
+        # 遍历不可变快照，监听列表在迭代期间变化也不受影响
+        for watcher_key, file_path in self._watched_entries:
+            self._check_file_change(watcher_key, file_path)
+    
+    def _check_file_change(self, watcher_key: WatcherKey, file_path: str) -> None:
+        """检查单个文件是否变更，变更时读取内容并触发回调"""
+        callback = self._watchers.get(watcher_key)
+        if callback is None:
+            return
+        
+        try:
+            stat = os.stat(file_path)
+            last_state = self._file_state.get(file_path)
+            last_digest = last_state[2] if last_state is not None else None
 
-                # 如果是新文件或文件已修改
-                if last_mtime is None or current_mtime > last_mtime:
-                    logger.info(f"检测到文件变更: {file_path}")
-                    self._file_mtimes[str(file_path)] = current_mtime
+            # 如果是新文件或文件已修改
+            if last_state is None or (stat.st_mtime_ns, stat.st_size) != last_state[:2]:
+                logger.info(f"检测到文件变更: {file_path}")
+                self._file_state[file_path] = (stat.st_mtime_ns, stat.st_size, last_digest)
+                
+                try:
+                    content = self._read_config_file(file_path)
                     
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read().strip()
-                        
-                        if content:
-                            callback(content)
+                    if content:
+                        # 仅在内容确实变化时触发回调（touch、原样保存等只改变 mtime）
+                        digest = content_fingerprint(content)
+                        if digest == last_digest:
+                            logger.debug("文件内容未变化，跳过回调: %s", file_path)
                         else:
-                            logger.warning(f"配置文件变为空，跳过回调: {file_path}")
-                            
-                    except Exception as e:
-                        logger.error(f"读取变更后的文件失败: {file_path}, 错误: {e}")
+                            self._file_state[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+                            self._submit_callback(watcher_key, callback, content)
+                    else:
+                        logger.warning(f"配置文件变为空，跳过回调: {file_path}")
+                        
+                except Exception as e:
+                    logger.error(f"读取变更后的文件失败: {file_path}, 错误: {e}")
 
-            except FileNotFoundError:
-                # 文件可能在检查期间被删除
-                if str(file_path) in self._file_mtimes:
-                    del self._file_mtimes[str(file_path)]
-                logger.warning(f"文件在检查期间被删除: {file_path}")
-            
-            except Exception as e:
-                logger.error(f"检查文件变更时出错: {file_path}, 错误: {e}")
+        except FileNotFoundError:
+            # 文件尚未创建或已被删除，只在删除时提示一次
+            last_state = self._file_state.get(file_path)
+            if last_state is not None and last_state[0] is not None:
+                self._file_state[file_path] = (None, None, last_state[2])
+                logger.warning(f"配置文件已被删除: {file_path}")
+        
+        except Exception as e:
+            logger.error(f"检查文件变更时出错: {file_path}, 错误: {e}")
+    
+    def _submit_callback(self, watcher_key: WatcherKey, callback: Callable[[str], None], content: str) -> None:
+        """将变更回调交给回调线程执行，未连接时直接在当前线程执行"""
+        executor = self._callback_executor
+        if executor is None:
+            callback(content)
+            return
+        
+        try:
+            executor.submit(self._run_callback, watcher_key, callback, content)
+        except RuntimeError:
+            # 回调线程已关闭，说明正在断开连接
+            pass
+    
+    def _run_callback(self, watcher_key: WatcherKey, callback: Callable[[str], None], content: str) -> None:
+        """在回调线程中执行变更回调"""
+        # 排队期间可能已取消监听
+        if self._watchers.get(watcher_key) is not callback:
+            return
+        
+        try:
+            callback(content)
+        except Exception as e:
+            logger.error(f"执行配置变更回调失败: {watcher_key}, 错误: {e}")
     
     def create_sample_config(self, data_id: str, group: str, config_data: dict) -> Path:
         """
@@ -320,10 +689,11 @@ class FileProvider(AbstractProvider):
         
         with open(file_path, 'w', encoding='utf-8') as f:
             if file_ext in ['.yaml', '.yml'] and HAS_YAML:
-                yaml.dump(config_data, f, default_flow_style=False, 
+                import yaml
+                yaml.dump(config_data, f, Dumper=_get_yaml_dumper(), default_flow_style=False,
                          allow_unicode=True, indent=2)
             else:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+                f.write(json_utils.dumps(config_data, indent=True))
         
         logger.info(f"已创建示例配置文件: {file_path}")
         return file_path 
\ No newline at end of file
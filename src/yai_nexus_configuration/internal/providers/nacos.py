@@ -7,19 +7,74 @@ YAI Nexus Configuration - Nacos Provider
 Nacos 配置中心的具体实现，提供与 Nacos 服务器的交互功能。
 """
 
-import json
 import logging
-from typing import Callable, Optional, Union, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union, List
 
 from .base import AbstractProvider
 from ...exceptions import ProviderConnectionError, ConfigSourceError
 
 logger = logging.getLogger(__name__)
 
-try:
-    import nacos
-except ImportError:
-    nacos = None
+# 批量获取配置时的最大并发请求数
+_MAX_CONCURRENT_FETCHES = 8
+
+# 进程内共享的 Nacos 客户端: 连接参数 -> [客户端, 引用计数]
+# 同一服务端的多个 Provider 共用一个客户端，避免重复的连接池和长轮询线程
+_CLIENT_POOL: Dict[Hashable, List[Any]] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _client_pool_key(client_config: Dict[str, Any]) -> Optional[Hashable]:
+    """根据客户端参数生成共享键，参数不可哈希时返回 None（不共享）"""
+    items = []
+    for name, value in sorted(client_config.items()):
+        if isinstance(value, list):
+            value = tuple(value)
+        items.append((name, value))
+    key = tuple(items)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _acquire_client(nacos: Any, client_config: Dict[str, Any]) -> Any:
+    """获取共享的 Nacos 客户端，不存在时创建"""
+    key = _client_pool_key(client_config)
+    if key is None:
+        return nacos.NacosClient(**client_config)
+    
+    with _CLIENT_POOL_LOCK:
+        entry = _CLIENT_POOL.get(key)
+        if entry is None:
+            entry = _CLIENT_POOL[key] = [nacos.NacosClient(**client_config), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_client(client: Any) -> None:
+    """释放共享的 Nacos 客户端，引用计数归零时从池中移除"""
+    with _CLIENT_POOL_LOCK:
+        for key, entry in _CLIENT_POOL.items():
+            if entry[0] is client:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del _CLIENT_POOL[key]
+                return
+
+
+def _import_nacos() -> Any:
+    """按需导入 nacos SDK，避免在未使用 Nacos 时加载它"""
+    try:
+        import nacos
+    except ImportError:
+        raise ImportError(
+            "nacos-sdk-python 未安装。请运行: pip install nacos-sdk-python"
+        )
+    return nacos
 
 
 class NacosProvider(AbstractProvider):
@@ -52,17 +107,14 @@ class NacosProvider(AbstractProvider):
         """
         super().__init__("Nacos")
         
-        if nacos is None:
-            raise ImportError(
-                "nacos-sdk-python 未安装。请运行: pip install nacos-sdk-python"
-            )
+        self._nacos = _import_nacos()
         
         self.server_addresses = server_addresses
         self.namespace = namespace
         self.username = username
         self.password = password
         self.client_kwargs = kwargs
-        self._client: Optional[nacos.NacosClient] = None
+        self._client: Optional[Any] = None
     
     def connect(self) -> None:
         """
@@ -71,6 +123,10 @@ class NacosProvider(AbstractProvider):
         Raises:
             ProviderConnectionError: 连接失败时抛出
         """
+        if self._client is not None:
+            _release_client(self._client)
+            self._client = None
+        
         try:
             # 构建客户端参数
             client_config = {
@@ -86,15 +142,8 @@ class NacosProvider(AbstractProvider):
                     'password': self.password
                 })
             
-            self._client = nacos.NacosClient(**client_config)
-            
-            # 测试连接
-            try:
-                # 尝试获取一个不存在的配置来测试连接
-                self._client.get_config("__connection_test__", "DEFAULT_GROUP", no_snapshot=True)
-            except Exception:
-                # 预期会失败，但这说明连接是正常的
-                pass
+            # 不发送探测请求，服务端不可用时由首次 get_config 报错
+            self._client = _acquire_client(self._nacos, client_config)
             
             self._set_connected(True)
             logger.info(f"成功连接到 Nacos 服务器: {self.server_addresses}")
@@ -106,7 +155,15 @@ class NacosProvider(AbstractProvider):
     def disconnect(self) -> None:
         """断开与 Nacos 服务器的连接"""
         if self._client:
-            # Nacos 客户端没有显式的断开连接方法，直接置空
+            # 客户端可能被其他 Provider 共用，先移除本 Provider 注册的监听器
+            for (group, data_id), callback in list(self._watchers.items()):
+                try:
+                    self._client.remove_config_watcher(data_id, group, cb=callback)
+                except Exception as e:
+                    logger.warning(f"取消配置监听器时出错: {group}/{data_id}, 错误: {str(e)}")
+            
+            # Nacos 客户端没有显式的断开连接方法，归还到共享池后置空
+            _release_client(self._client)
             self._client = None
         
         self._set_connected(False)
@@ -139,13 +196,37 @@ class NacosProvider(AbstractProvider):
                     "配置不存在或返回空内容"
                 )
             
-            logger.debug(f"成功获取配置: {group}/{data_id}")
+            logger.debug("成功获取配置: %s/%s", group, data_id)
             return config_content
             
         except Exception as e:
             logger.error(f"获取配置失败: {group}/{data_id}, 错误: {str(e)}")
             raise ConfigSourceError(data_id, group, "get_config", str(e))
     
+    def get_configs(self, items: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """
+        并发地批量获取 Nacos 配置
+        
+        Nacos 的批量监听接口只返回发生变化的配置键而不返回内容，因此这里
+        并发发出多个 get_config 请求，启动耗时从 N 次往返降为约 1 次往返。
+        
+        Args:
+            items: (data_id, group) 列表
+            
+        Returns:
+            (data_id, group) 到配置原始字符串的映射
+            
+        Raises:
+            ConfigSourceError: 任一配置获取失败时抛出
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return super().get_configs(items)
+        
+        with ThreadPoolExecutor(max_workers=min(len(items), _MAX_CONCURRENT_FETCHES)) as executor:
+            contents = executor.map(lambda item: self.get_config(*item), items)
+            return dict(zip(items, contents))
+    
     def watch_config(self, data_id: str, group: str, callback: Callable[[str], None]) -> None:
         """
         监听 Nacos 配置变更
@@ -7,9 +7,12 @@ YAI Nexus Configuration - 配置存储模块
 提供线程安全的配置实例存储和管理功能。
 """
 
+import itertools
 import threading
 import logging
-from typing import Type, TypeVar, Dict, Optional, Any
+import weakref
+from types import MappingProxyType
+from typing import Type, TypeVar, Dict, Mapping, Optional, Any, Tuple
 from pydantic import BaseModel
 
 from ..config import NexusConfig
@@ -25,11 +28,36 @@ class ConfigStore:
     线程安全的配置存储中心
     
     管理所有已注册配置类的实例，提供线程安全的存储、检索和更新操作。
+    
+    读操作不加锁：单次 dict 查找在 CPython 中是原子的。写操作只持有
+    对应配置类的锁，不同配置类的更新互不阻塞。
     """
     
+    __slots__ = ('_store', '_locks', '_locks_guard', '_generations', '_generation', '_all_configs_view')
+    
     def __init__(self):
         self._store: Dict[Type[BaseModel], BaseModel] = {}
-        self._lock = threading.RLock()  # 使用可重入锁
+        # 每个配置类一把锁，配置类被回收后自动移除。持有锁期间不会再调用其他加锁的方法，
+        # 因此使用开销更低的非可重入锁
+        self._locks: "weakref.WeakKeyDictionary[Type[BaseModel], threading.Lock]" = weakref.WeakKeyDictionary()
+        # 仅保护 _locks 的创建
+        self._locks_guard = threading.Lock()
+        # 每次写入后递增的版本号，用于判断 get_all_configs 的缓存视图是否过期
+        self._generations = itertools.count(1)
+        self._generation = 0
+        self._all_configs_view: Optional[Tuple[int, Mapping[str, BaseModel]]] = None
+    
+    def _invalidate(self) -> None:
+        """在修改 _store 之后调用，使 get_all_configs 的缓存视图失效"""
+        self._generation = next(self._generations)
+    
+    def _lock_for(self, config_class: Type[BaseModel]) -> threading.Lock:
+        """获取（必要时创建）指定配置类的锁"""
+        lock = self._locks.get(config_class)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(config_class, threading.Lock())
+        return lock
         
     def set_config(self, config_instance: T) -> None:
         """
@@ -43,9 +71,10 @@ class ConfigStore:
             
         config_class = type(config_instance)
         
-        with self._lock:
+        with self._lock_for(config_class):
             old_instance = self._store.get(config_class)
             self._store[config_class] = config_instance
+            self._invalidate()
             
             if old_instance:
                 logger.info(f"更新配置实例: {config_class.__name__}")
@@ -65,10 +94,10 @@ class ConfigStore:
         Raises:
             ConfigNotRegisteredError: 如果配置未注册
         """
-        with self._lock:
-            if config_class not in self._store:
-                raise ConfigNotRegisteredError(config_class)
-            return self._store[config_class]
+        instance = self._store.get(config_class)
+        if instance is None:
+            raise ConfigNotRegisteredError(config_class)
+        return instance
     
     def has_config(self, config_class: Type[T]) -> bool:
         """
@@ -80,8 +109,15 @@ class ConfigStore:
         Returns:
             True 如果配置存在，否则 False
         """
-        with self._lock:
-            return config_class in self._store
+        return config_class in self._store
+    
+    def __contains__(self, config_class: Type[T]) -> bool:
+        """
+        `config_class in store`，与 has_config() 相同
+        
+        只需判断是否存在时应使用此方法，而不是捕获 get_config 抛出的 ConfigNotRegisteredError。
+        """
+        return config_class in self._store
     
     def remove_config(self, config_class: Type[T]) -> bool:
         """
@@ -93,39 +129,57 @@ class ConfigStore:
         Returns:
             True 如果成功移除，False 如果配置不存在
         """
-        with self._lock:
-            if config_class in self._store:
-                del self._store[config_class]
+        with self._lock_for(config_class):
+            if self._store.pop(config_class, None) is not None:
+                self._invalidate()
                 logger.info(f"移除配置实例: {config_class.__name__}")
                 return True
             return False
     
-    def get_all_configs(self) -> Dict[str, BaseModel]:
+    def get_all_configs(self) -> Mapping[str, BaseModel]:
         """
         获取所有配置实例
         
+        返回只读快照，配置未变化时重复调用返回同一个对象，不再每次构建新字典。
+        
         Returns:
-            配置类名到配置实例的映射
+            配置类名到配置实例的只读映射
         """
-        with self._lock:
-            return {cls.__name__: instance for cls, instance in self._store.items()}
+        # 先读取版本号再复制快照：复制期间若有写入，版本号已变化，下次调用会重新构建
+        generation = self._generation
+        cached = self._all_configs_view
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        
+        # dict.copy 在 CPython 中是原子的，避免遍历期间被修改
+        view = MappingProxyType(
+            {cls.__name__: instance for cls, instance in self._store.copy().items()}
+        )
+        self._all_configs_view = (generation, view)
+        return view
     
     def clear(self) -> None:
         """清空所有配置"""
-        with self._lock:
-            count = len(self._store)
-            self._store.clear()
-            logger.info(f"清空了 {count} 个配置实例")
+        count = len(self._store)
+        self._store.clear()
+        self._invalidate()
+        logger.info(f"清空了 {count} 个配置实例")
     
     def get_config_count(self) -> int:
         """获取配置数量"""
-        with self._lock:
-            return len(self._store)
+        return len(self._store)
+    
+    def __len__(self) -> int:
+        """配置数量，与 get_config_count() 相同（dict 的 len 是原子操作，无需加锁）"""
+        return len(self._store)
     
     def update_config_field(self, config_class: Type[T], field_name: str, field_value: Any) -> T:
         """
         原子化更新配置的单个字段
         
+        基于当前实例的浅拷贝生成新实例，只对被修改的字段做验证，
+        原实例保持不变。
+        
         Args:
             config_class: 配置类型
             field_name: 字段名
@@ -137,17 +191,24 @@ class ConfigStore:
         Raises:
             ConfigNotRegisteredError: 如果配置未注册
         """
-        with self._lock:
-            if config_class not in self._store:
+        with self._lock_for(config_class):
+            current_instance = self._store.get(config_class)
+            if current_instance is None:
                 raise ConfigNotRegisteredError(config_class)
-                
-            current_instance = self._store[config_class]
-            current_data = current_instance.model_dump()
-            current_data[field_name] = field_value
             
-            # 创建新实例以确保数据一致性
-            new_instance = config_class(**current_data)
+            if field_name in config_class.model_fields:
+                # 浅拷贝当前实例，只验证被修改的字段（模型级验证器仍会执行）
+                new_instance = current_instance.model_copy()
+                config_class.__pydantic_validator__.validate_assignment(
+                    new_instance, field_name, field_value
+                )
+            else:
+                # 未声明的字段：按模型配置重新构建完整实例
+                current_data = current_instance.model_dump()
+                current_data[field_name] = field_value
+                new_instance = config_class(**current_data)
             self._store[config_class] = new_instance
+            self._invalidate()
             
             logger.info(f"更新配置字段: {config_class.__name__}.{field_name}")
             return new_instance
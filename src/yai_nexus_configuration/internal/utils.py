@@ -1,14 +1,89 @@
 import os
-from string import Template
-from typing import Any
+import re
+from typing import Any, Dict, Hashable, List, Tuple, Union
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+    xxhash = None
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+    blake3 = None
+
+
+# 预编译的占位符正则：与 string.Template 的 `${VAR}`、`$VAR`、`$$` 转义语义一致，
+# 另外支持 `${VAR:-default}` 形式的默认值
+_ENV_VAR_PATTERN = re.compile(
+    r"""
+    \$(?:
+      (?P<escaped>\$)                                       |
+      (?P<named>[_a-z][_a-z0-9]*)                          |
+      {(?P<braced>[_a-z][_a-z0-9]*)(?::-(?P<default>[^}]*))?} |
+      (?P<invalid>)
+    )
+    """,
+    re.IGNORECASE | re.ASCII | re.VERBOSE,
+)
+
+
+def _substitute_env_vars(value: str, env: Dict[str, str]) -> str:
+    """
+    替换单个字符串中的环境变量占位符，行为与 Template.safe_substitute 相同
+
+    未定义的变量使用 `${VAR:-default}` 中的默认值，没有默认值时保持原样；
+    不合法的占位符保持原样，`$$` 转义为 `$`。
+    """
+    if '$' not in value:
+        return value
+
+    def replace(match: "re.Match[str]") -> str:
+        name = match.group('named') or match.group('braced')
+        if name is not None:
+            value = env.get(name)
+            if value is not None:
+                return value
+            default = match.group('default')
+            return default if default is not None else match.group()
+        if match.group('escaped') is not None:
+            return '$'
+        return match.group()
+
+    return _ENV_VAR_PATTERN.sub(replace, value)
+
+
+def referenced_env_vars(content: str) -> Tuple[str, ...]:
+    """
+    找出内容中引用的所有环境变量名（按出现顺序，可能重复）
+
+    Args:
+        content: 配置内容的原始字符串
+
+    Returns:
+        被 `${VAR}`、`${VAR:-default}` 或 `$VAR` 引用的变量名
+    """
+    if '$' not in content:
+        return ()
+    return tuple(
+        match.group('named') or match.group('braced')
+        for match in _ENV_VAR_PATTERN.finditer(content)
+        if match.group('named') or match.group('braced')
+    )
 
 
 def recursive_replace_env_vars(config_part: Any) -> Any:
     """
-    递归地遍历配置结构（字典、列表），并使用 string.Template
-    安全地替换所有字符串中格式为 `${VAR_NAME}` 或 `$VAR_NAME` 的环境变量。
+    遍历配置结构（字典、列表），安全地替换所有字符串中格式为
+    `${VAR_NAME}`、`${VAR_NAME:-default}` 或 `$VAR_NAME` 的环境变量，
+    `$$` 会被转义为一个普通的 `$`。
 
-    这种方法比手动解析正则表达式更健壮、更安全。
+    每次调用只读取一次 os.environ 快照；使用显式栈迭代遍历，
+    嵌套再深也不会触及递归深度限制；不含 `$` 的字符串直接原样返回。
 
     Args:
         config_part: 配置数据的一部分，可以是字典、列表、字符串或任何其他类型。
@@ -17,18 +92,55 @@ def recursive_replace_env_vars(config_part: Any) -> Any:
         处理过的配置部分，其中环境变量已被其值替换。
         如果环境变量未找到，占位符将保持原样。
     """
-    if isinstance(config_part, dict):
-        return {k: recursive_replace_env_vars(v) for k, v in config_part.items()}
-
-    if isinstance(config_part, list):
-        return [recursive_replace_env_vars(i) for i in config_part]
+    env = os.environ.copy()
 
     if isinstance(config_part, str):
-        # 使用 string.Template 的 safe_substitute 方法。
-        # 它专门用于处理环境变量替换，如果变量在 os.environ 中不存在，
-        # 它会安全地将占位符（如 ${MY_VAR}）保留在原地，而不会引发错误。
-        # 同时，它也正确支持使用 $$ 来转义成一个普通的 $ 符号。
-        return Template(config_part).safe_substitute(os.environ)
-
-    # 对于非字符串、字典、列表的任何其他数据类型（如 int, bool, None），原样返回。
-    return config_part 
\ No newline at end of file
+        return _substitute_env_vars(config_part, env)
+    if not isinstance(config_part, (dict, list)):
+        # 对于非字符串、字典、列表的任何其他数据类型（如 int, bool, None），原样返回。
+        return config_part
+
+    result: Union[Dict[Any, Any], List[Any]] = {} if isinstance(config_part, dict) else []
+    # 待处理的 (原容器, 新容器) 对，子容器先以空容器占位，出栈时再填充
+    stack: List[Tuple[Any, Any]] = [(config_part, result)]
+    while stack:
+        source, target = stack.pop()
+        is_dict = isinstance(source, dict)
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            if isinstance(value, str):
+                value = _substitute_env_vars(value, env)
+            elif isinstance(value, dict):
+                stack.append((value, {}))
+                value = stack[-1][1]
+            elif isinstance(value, list):
+                stack.append((value, []))
+                value = stack[-1][1]
+
+            if is_dict:
+                target[key] = value
+            else:
+                target.append(value)
+
+    return result
+
+
+def content_fingerprint(content: Union[str, bytes]) -> Hashable:
+    """
+    计算配置内容的指纹，用于判断内容是否发生变化。
+
+    依次优先使用 xxhash (XXH3 64 位)、blake3，均未安装时使用内置的 hash()。
+    指纹只保证在当前进程内可比较，不应持久化。
+
+    Args:
+        content: 配置内容的原始字符串或字节串
+
+    Returns:
+        可用于相等比较的指纹值
+    """
+    if HAS_XXHASH or HAS_BLAKE3:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if HAS_XXHASH:
+            return xxhash.xxh3_64_intdigest(content)
+        return blake3.blake3(content).digest()
+    return hash(content)
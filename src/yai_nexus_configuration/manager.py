@@ -7,17 +7,21 @@ YAI Nexus Configuration - 核心管理器
 NexusConfigManager 是整个配置系统的入口，采用工厂模式设计，提供优雅的 API。
 """
 
-import json
-import yaml
+import copy
+import functools
 import logging
+import os
 import warnings  # 导入 warnings 模块
 import threading
+import weakref
 from pathlib import Path
-from typing import Type, TypeVar, Dict, Any, Optional, Union, List
+from pydantic import ValidationError
+from typing import Type, TypeVar, Callable, Dict, Any, FrozenSet, Hashable, Iterable, Mapping, Optional, Tuple, Union, List
 
 from .internal.providers import AbstractProvider, NacosProvider, FileProvider
 from .internal.store import ConfigStore
-from .internal.utils import recursive_replace_env_vars  # 导入新函数
+from .internal import json_utils
+from .internal.utils import recursive_replace_env_vars, referenced_env_vars, content_fingerprint
 from .decorator import get_config_metadata
 from .exceptions import (
     ConfigNotRegisteredError,
@@ -30,6 +34,86 @@ T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_yaml_loader() -> Any:
+    """
+    获取 YAML 安全加载器（首次调用时才导入 PyYAML）
+    
+    优先使用基于 libyaml 的 C 解析器，未编译 libyaml 时回退到纯 Python 实现。
+    """
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_yaml_data_id(data_id: str) -> bool:
+    """
+    根据 data_id 的扩展名判断内容是否为 YAML 格式
+    
+    每次配置变更都需要判断格式，而 data_id 在注册后不变，结果按 data_id 缓存。
+    """
+    return data_id.lower().endswith(('.yaml', '.yml'))
+
+
+# 配置类 -> _declared_input_keys 的结果。弱引用配置类，动态创建的配置类不会因缓存而无法回收
+_declared_input_keys_cache: "weakref.WeakKeyDictionary[Type, Optional[FrozenSet[str]]]" = weakref.WeakKeyDictionary()
+
+
+def _declared_input_keys(config_class: Type) -> Optional[FrozenSet[str]]:
+    """获取配置类会读取的顶层键，结果按配置类缓存（见 _collect_declared_input_keys）"""
+    try:
+        return _declared_input_keys_cache[config_class]
+    except KeyError:
+        pass
+    keys = _collect_declared_input_keys(config_class)
+    _declared_input_keys_cache[config_class] = keys
+    return keys
+
+
+def _collect_declared_input_keys(config_class: Type) -> Optional[FrozenSet[str]]:
+    """
+    获取配置类会读取的顶层键（字段名及字符串别名）
+    
+    配置类忽略未声明的字段时，其余顶层键的值不会被使用，环境变量替换可以跳过它们。
+    配置类允许或禁止额外字段、使用 AliasPath/AliasChoices，或定义了 before/wrap 模式的
+    模型验证器（可能读取任意顶层键）时返回 None，表示所有键都需要替换。
+    """
+    if config_class.model_config.get('extra') not in (None, 'ignore'):
+        return None
+    model_validators = config_class.__pydantic_decorators__.model_validators.values()
+    if any(validator.info.mode in ('before', 'wrap') for validator in model_validators):
+        return None
+    keys = set()
+    for name, field in config_class.model_fields.items():
+        if field.validation_alias is not None and not isinstance(field.validation_alias, str):
+            return None
+        keys.add(name)
+        keys.update(alias for alias in (field.alias, field.validation_alias) if isinstance(alias, str))
+    return frozenset(keys)
+
+
+def _dispatch_change(
+    manager_ref: "weakref.ReferenceType[NexusConfigManager]",
+    config_class: Type,
+    data_id: str,
+    new_content: str
+) -> None:
+    """
+    配置变更回调，由 Provider 在配置源变更时调用
+    
+    通过 functools.partial 绑定参数后注册到 Provider，避免为每个配置创建闭包。
+    只持有管理器的弱引用，Provider 未清理的监听器不会让管理器无法回收。
+    """
+    manager = manager_ref()
+    if manager is None:
+        return
+    try:
+        with manager._class_lock(config_class):
+            manager._apply_config_change(config_class, new_content, data_id)
+    except Exception as e:
+        logger.error(f"处理配置变更时出错: {config_class.__name__}, 错误: {e}")
+
+
 class NexusConfigManager:
     """
     配置管理器
@@ -44,7 +128,7 @@ class NexusConfigManager:
     - 类型安全：完整的类型提示支持
     """
     
-    def __init__(self, provider: Optional[AbstractProvider] = None):
+    def __init__(self, provider: Optional[AbstractProvider] = None, trust_reload: bool = False):
         """
         初始化管理器
         
@@ -52,6 +136,10 @@ class NexusConfigManager:
         
         Args:
             provider: 配置提供者实例
+            trust_reload: 是否信任重新加载的配置内容。为 True 时，首次注册仍做完整验证，
+                之后的重新加载通过 `model_construct` 直接构建实例，跳过 Pydantic 验证。
+                仅在配置源可信且内容结构不会出错时使用：字段类型不会被转换，
+                嵌套模型也会保留为字典
         """
         if provider is None:
             warnings.warn(
@@ -69,7 +157,20 @@ class NexusConfigManager:
 
         self._store = ConfigStore()
         self._registered_configs: Dict[Type, Dict[str, str]] = {}
-        self._lock = threading.RLock()
+        # 配置类 -> (原始内容指纹, 由该内容构建的实例)
+        self._instance_cache: Dict[Type, Tuple[Hashable, Any]] = {}
+        # get_manager_info 的缓存结果，注册状态变化时失效
+        self._info_cache: Optional[Dict[str, Any]] = None
+        # 每个配置类一把锁，不同配置类的注册、重新加载互不阻塞；
+        # _meta_lock 只保护 _class_locks 的创建以及 close/get_manager_info；
+        # 需要同时持有两者时，总是先取类锁再取 _meta_lock
+        self._class_locks: Dict[Type, threading.RLock] = {}
+        self._meta_lock = threading.RLock()
+        # 配置因配置源变更而更新时置位，供 wait_for_change 使用
+        self._change_event = threading.Event()
+        # 配置更新或管理器关闭时调用的无参回调，供 NexusConfigManagerAsync 等桥接通知
+        self._change_listeners: List[Callable[[], None]] = []
+        self._trust_reload = trust_reload
         self._closed = False
         
     @classmethod
@@ -79,6 +180,7 @@ class NexusConfigManager:
         namespace: str = "",
         username: Optional[str] = None,
         password: Optional[str] = None,
+        trust_reload: bool = False,
         **kwargs: Any
     ) -> "NexusConfigManager":
         """
@@ -89,6 +191,7 @@ class NexusConfigManager:
             namespace: 命名空间，默认为空（公共命名空间）
             username: 用户名（可选）
             password: 密码（可选）
+            trust_reload: 重新加载时是否跳过验证，见 `NexusConfigManager.__init__`
             **kwargs: 其他传递给 Nacos 客户端的参数
             
         Returns:
@@ -106,7 +209,7 @@ class NexusConfigManager:
             password=password,
             **kwargs
         )
-        return cls(provider)
+        return cls(provider, trust_reload=trust_reload)
     
     @classmethod
     def with_file(
@@ -114,7 +217,9 @@ class NexusConfigManager:
         base_path: Union[str, Path] = "configs",
         default_format: str = "json",
         watch_interval: float = 1.0,
-        auto_create_dirs: bool = True
+        auto_create_dirs: bool = True,
+        trust_reload: bool = False,
+        debounce_interval: float = 0.1
     ) -> "NexusConfigManager":
         """
         使用本地文件作为配置源创建管理器
@@ -124,6 +229,9 @@ class NexusConfigManager:
             default_format: 默认文件格式，支持 "json" 或 "yaml"，默认为 "json"
             watch_interval: 文件变更监听间隔（秒），默认为 1.0
             auto_create_dirs: 是否自动创建不存在的目录，默认为 True
+            trust_reload: 重新加载时是否跳过验证，见 `NexusConfigManager.__init__`
+            debounce_interval: 合并同一文件连续变更事件的时间窗口（秒），默认为 0.1。
+                编辑器保存时的多次写入只会触发一次重新解析
             
         Returns:
             配置好的 NexusConfigManager 实例
@@ -149,17 +257,33 @@ class NexusConfigManager:
             base_path=base_path,
             default_format=default_format,
             watch_interval=watch_interval,
-            auto_create_dirs=auto_create_dirs
+            auto_create_dirs=auto_create_dirs,
+            debounce_interval=debounce_interval
         )
-        return cls(provider)
+        return cls(provider, trust_reload=trust_reload)
+    
+    def _class_lock(self, config_class: Type) -> threading.RLock:
+        """获取（必要时创建）指定配置类的锁"""
+        lock = self._class_locks.get(config_class)
+        if lock is None:
+            with self._meta_lock:
+                lock = self._class_locks.setdefault(config_class, threading.RLock())
+        return lock
     
-    def _parse_config_content(self, content: str, data_id: str) -> Dict[str, Any]:
+    def _parse_config_content(
+        self,
+        content: str,
+        data_id: str,
+        keep_keys: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, Any]:
         """
         智能解析配置内容，支持 JSON 和 YAML，并自动替换环境变量。
         
         Args:
             content: 配置内容的原始字符串
             data_id: 配置文件名，用于推断格式
+            keep_keys: 需要做环境变量替换的顶层键，为 None 时替换全部。
+                其余键原样保留，避免遍历配置类用不到的子树
             
         Returns:
             解析后的配置字典
@@ -167,20 +291,20 @@ class NexusConfigManager:
         Raises:
             ConfigValidationError: 如果解析失败或格式不正确
         """
-        lowered_data_id = data_id.lower()
         data: Any
 
         # 严格根据文件扩展名选择解析器
-        if lowered_data_id.endswith(('.yaml', '.yml')):
+        if _is_yaml_data_id(data_id):
+            import yaml
             try:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_get_yaml_loader())
             except yaml.YAMLError as e:
                 raise ConfigValidationError(data_id, f"YAML 解析失败: {e}")
         else:
             # 默认为 JSON 解析
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError as e:
+                data = json_utils.loads(content)
+            except json_utils.JSONDecodeError as e:
                 raise ConfigValidationError(data_id, f"JSON 解析失败: {e}")
 
         # 验证解析后的根对象必须是字典
@@ -190,10 +314,98 @@ class NexusConfigManager:
                 f"配置内容必须是字典/映射格式，但解析后得到的是 {type(data).__name__}"
             )
         
-        # 新增步骤：在验证前进行环境变量替换
-        processed_data = recursive_replace_env_vars(data)
+        # 新增步骤：在验证前进行环境变量替换（内容不含 `$` 时无需遍历）
+        if '$' not in content:
+            return data
+        if keep_keys is None:
+            return recursive_replace_env_vars(data)
+        # 只替换声明的键，返回的仍是完整映射，验证时看到的输入与内容是否含 `$` 无关
+        declared = {key: value for key, value in data.items() if key in keep_keys}
+        data.update(recursive_replace_env_vars(declared))
+        return data
+
+    def _validate_json_content(self, config_class: Type[T], content: str, data_id: str) -> T:
+        """
+        直接从 JSON 文本构建配置实例
+        
+        使用 Pydantic 的 `model_validate_json` 在 pydantic-core 中一次完成解析和验证，
+        不再生成中间字典。仅适用于不需要环境变量替换的 JSON 内容。
+        
+        Args:
+            config_class: 配置类型
+            content: JSON 配置内容
+            data_id: 配置文件名，用于错误信息
+            
+        Returns:
+            配置实例
+            
+        Raises:
+            ConfigValidationError: 如果内容不是合法的 JSON 对象
+            ValidationError: 如果字段验证失败
+        """
+        try:
+            return config_class.model_validate_json(content)
+        except ValidationError as e:
+            errors = e.errors()
+            if errors and not errors[0]['loc']:
+                # 根对象层面的错误：非法 JSON 或根节点不是对象
+                if errors[0]['type'] == 'json_invalid':
+                    raise ConfigValidationError(data_id, f"JSON 解析失败: {errors[0]['msg']}")
+                if errors[0]['type'] == 'model_type':
+                    raise ConfigValidationError(
+                        data_id,
+                        f"配置内容必须是字典/映射格式，但解析后得到的是 {type(errors[0]['input']).__name__}"
+                    )
+            raise
+
+    def _build_config_instance(
+        self,
+        config_class: Type[T],
+        raw_config: str,
+        data_id: str,
+        trusted: bool = False
+    ) -> T:
+        """
+        根据原始配置内容构建配置实例
+        
+        原始内容与上次构建时相同时直接复用之前的实例，跳过解析和验证。
+        内容引用了环境变量时，这些变量的当前值也是缓存键的一部分。
+        
+        Args:
+            config_class: 配置类型
+            raw_config: 配置内容的原始字符串
+            data_id: 配置文件名，用于推断格式
+            trusted: 是否跳过字段验证，直接用 `model_construct` 构建实例
             
-        return processed_data
+        Returns:
+            配置实例
+        """
+        has_placeholders = '$' in raw_config
+        fingerprint: Hashable = content_fingerprint(raw_config)
+        if has_placeholders:
+            env_values = tuple(os.environ.get(name) for name in referenced_env_vars(raw_config))
+            fingerprint = (fingerprint, env_values)
+        
+        cached = self._instance_cache.get(config_class)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        if trusted:
+            config_data = self._parse_config_content(
+                raw_config, data_id, _declared_input_keys(config_class)
+            )
+            config_instance = config_class.model_construct(**config_data)
+        elif not has_placeholders and not _is_yaml_data_id(data_id):
+            # 无需环境变量替换的 JSON 内容直接交给 Pydantic 解析
+            config_instance = self._validate_json_content(config_class, raw_config, data_id)
+        else:
+            config_data = self._parse_config_content(
+                raw_config, data_id, _declared_input_keys(config_class)
+            )
+            config_instance = config_class.model_validate(config_data)
+        
+        self._instance_cache[config_class] = (fingerprint, config_instance)
+        return config_instance
 
     def register(self, config_class: Type[T]) -> None:
         """
@@ -211,8 +423,13 @@ class NexusConfigManager:
             MissingConfigMetadataError: 如果配置类缺少必要的元数据
             ConfigValidationError: 如果配置数据验证失败
         """
-        with self._lock:
-            # 检查是否已注册
+        # 快速路径：已注册时无需加锁（dict 成员判断在 CPython 中是原子的）
+        if config_class in self._registered_configs:
+            logger.warning(f"配置类 {config_class.__name__} 已经注册，跳过")
+            return
+        
+        with self._class_lock(config_class):
+            # 加锁后再次检查，其他线程可能刚完成注册
             if config_class in self._registered_configs:
                 logger.warning(f"配置类 {config_class.__name__} 已经注册，跳过")
                 return
@@ -222,32 +439,174 @@ class NexusConfigManager:
             if not metadata:
                 raise MissingConfigMetadataError(config_class, "nexus_config")
             
-            data_id = metadata['data_id']
-            group = metadata['group']
-            
             # 从配置源获取初始配置
-            try:
-                raw_config = self._provider.get_config(data_id, group)
-                config_data = self._parse_config_content(raw_config, data_id)
-                
-                # 创建配置实例
-                config_instance = config_class(**config_data)
-                self._store.set_config(config_instance)
-                
-                # 记录注册信息
+            raw_config = self._provider.get_config(metadata['data_id'], metadata['group'])
+            self._register_loaded(config_class, metadata, raw_config)
+    
+    def _register_loaded(self, config_class: Type, metadata: Dict[str, Any], raw_config: str) -> None:
+        """
+        使用已获取的原始内容完成注册（调用方需持有该配置类的锁）
+        
+        Args:
+            config_class: 配置类型
+            metadata: 配置类的元数据
+            raw_config: 从配置源获取的原始配置内容
+        """
+        data_id = metadata['data_id']
+        group = metadata['group']
+        
+        try:
+            # 创建配置实例（按配置源实际对应的文件名选择解析器）
+            config_instance = self._build_config_instance(
+                config_class, raw_config, self._provider.resolve_data_id(data_id, group)
+            )
+            self._store.set_config(config_instance)
+            
+            # 记录注册信息
+            with self._meta_lock:
                 self._registered_configs[config_class] = metadata
-                
-                # 开始监听配置变更
+            
+            # 开始监听配置变更。状态信息缓存在监听注册之后才失效，
+            # 否则期间并发调用 get_manager_info 会缓存旧的 watchers_count
+            try:
                 self._start_watching(config_class, data_id, group)
-                
-                logger.info(f"成功注册配置: {config_class.__name__} ({group}/{data_id})")
-                
-            except ConfigValidationError:
-                raise
+            finally:
+                with self._meta_lock:
+                    self._info_cache = None
+            
+            logger.info(f"成功注册配置: {config_class.__name__} ({group}/{data_id})")
+            
+        except ValidationError as e:
+            raise ConfigValidationError(f"{group}/{data_id}", str(e))
+    
+    def register_many(self, config_classes: Iterable[Type]) -> None:
+        """
+        批量注册配置类
+        
+        先校验所有配置类的元数据，再通过 Provider 的 `get_configs` 一次获取
+        所有未注册配置的内容（NacosProvider 会并发请求），最后依次完成注册。
+        任一配置类缺少元数据时不会注册其中任何一个。
+        
+        Args:
+            config_classes: 被 @nexus_config 装饰的配置类集合
+            
+        Raises:
+            MissingConfigMetadataError: 如果某个配置类缺少必要的元数据
+            ConfigValidationError: 如果配置数据验证失败
+        """
+        pending: Dict[Type, Dict[str, Any]] = {}
+        for config_class in config_classes:
+            metadata = get_config_metadata(config_class)
+            if not metadata:
+                raise MissingConfigMetadataError(config_class, "nexus_config")
+            if config_class in self._registered_configs:
+                logger.warning(f"配置类 {config_class.__name__} 已经注册，跳过")
+                continue
+            pending[config_class] = metadata
+        
+        if not pending:
+            return
+        
+        raw_configs = self._provider.get_configs(
+            [(metadata['data_id'], metadata['group']) for metadata in pending.values()]
+        )
+        
+        for config_class, metadata in pending.items():
+            with self._class_lock(config_class):
+                # 获取期间可能已被其他线程注册
+                if config_class in self._registered_configs:
+                    continue
+                raw_config = raw_configs[(metadata['data_id'], metadata['group'])]
+                self._register_loaded(config_class, metadata, raw_config)
+    
+    def register_with_content(self, config_class: Type[T], raw_config: str) -> bool:
+        """
+        使用调用方已获取的原始内容注册配置类
+        
+        供在锁外获取配置内容的调用方（如 NexusConfigManagerAsync）使用，
+        其余流程与 `register` 相同。
+        
+        Args:
+            config_class: 被 @nexus_config 装饰的配置类
+            raw_config: 从配置源获取的原始配置内容
+            
+        Returns:
+            True 如果注册成功，False 如果配置类已经注册
+            
+        Raises:
+            MissingConfigMetadataError: 如果配置类缺少必要的元数据
+            ConfigValidationError: 如果配置数据验证失败
+        """
+        metadata = get_config_metadata(config_class)
+        if not metadata:
+            raise MissingConfigMetadataError(config_class, "nexus_config")
+        
+        with self._class_lock(config_class):
+            if config_class in self._registered_configs:
+                logger.warning(f"配置类 {config_class.__name__} 已经注册，跳过")
+                return False
+            self._register_loaded(config_class, metadata, raw_config)
+            return True
+    
+    def reload_with_content(self, config_class: Type[T], raw_config: str) -> T:
+        """
+        使用调用方已获取的原始内容重新加载配置
+        
+        Args:
+            config_class: 配置类型
+            raw_config: 从配置源获取的原始配置内容
+            
+        Returns:
+            更新后的配置实例
+            
+        Raises:
+            ConfigNotRegisteredError: 如果配置未注册
+        """
+        with self._class_lock(config_class):
+            if config_class not in self._registered_configs:
+                raise ConfigNotRegisteredError(config_class)
+            return self._reload_loaded(config_class, raw_config)
+    
+    def is_registered(self, config_class: Type) -> bool:
+        """判断配置类是否已注册"""
+        return config_class in self._registered_configs
+    
+    @property
+    def provider(self) -> Optional[AbstractProvider]:
+        """当前使用的配置提供者"""
+        return self._provider
+    
+    @property
+    def closed(self) -> bool:
+        """管理器是否已关闭"""
+        return self._closed
+    
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        添加变更监听器
+        
+        监听器在配置因配置源变更而更新、以及管理器关闭时被调用，
+        调用发生在 Provider 的监听线程或调用 close 的线程中，应尽快返回。
+        
+        Args:
+            listener: 无参回调
+        """
+        self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[], None]) -> None:
+        """移除通过 add_change_listener 添加的监听器，未添加时忽略"""
+        try:
+            self._change_listeners.remove(listener)
+        except ValueError:
+            pass
+    
+    def _notify_change_listeners(self) -> None:
+        """依次调用变更监听器，单个监听器出错不影响其他监听器"""
+        for listener in list(self._change_listeners):
+            try:
+                listener()
             except Exception as e:
-                if "ValidationError" in str(type(e)):
-                    raise ConfigValidationError(f"{group}/{data_id}", str(e))
-                raise
+                logger.error(f"调用变更监听器时出错: {e}")
     
     def get_config(self, config_class: Type[T]) -> T:
         """
@@ -274,7 +633,11 @@ class NexusConfigManager:
         Returns:
             True 如果成功取消注册，False 如果配置未注册
         """
-        with self._lock:
+        # 未注册的配置类无需加锁，也不会为其创建锁
+        if config_class not in self._registered_configs:
+            return False
+        
+        with self._class_lock(config_class):
             if config_class not in self._registered_configs:
                 return False
             
@@ -287,7 +650,10 @@ class NexusConfigManager:
             
             # 移除存储
             self._store.remove_config(config_class)
-            del self._registered_configs[config_class]
+            self._instance_cache.pop(config_class, None)
+            with self._meta_lock:
+                del self._registered_configs[config_class]
+                self._info_cache = None
             
             logger.info(f"取消注册配置: {config_class.__name__}")
             return True
@@ -302,83 +668,165 @@ class NexusConfigManager:
         Returns:
             更新后的配置实例
         """
-        with self._lock:
+        # 未注册的配置类无需加锁，也不会为其创建锁
+        if config_class not in self._registered_configs:
+            raise ConfigNotRegisteredError(config_class)
+        
+        with self._class_lock(config_class):
             if config_class not in self._registered_configs:
                 raise ConfigNotRegisteredError(config_class)
             
             metadata = self._registered_configs[config_class]
-            data_id = metadata['data_id']
-            group = metadata['group']
-            
             try:
-                raw_config = self._provider.get_config(data_id, group)
-                config_data = self._parse_config_content(raw_config, data_id)
-                config_instance = config_class(**config_data)
-                
-                self._store.set_config(config_instance)
-                logger.info(f"重新加载配置: {config_class.__name__}")
-                return config_instance
-                
+                raw_config = self._provider.get_config(metadata['data_id'], metadata['group'])
             except Exception as e:
                 logger.error(f"重新加载配置失败: {config_class.__name__}, 错误: {e}")
                 raise
+            return self._reload_loaded(config_class, raw_config)
     
-    def get_all_configs(self) -> Dict[str, Any]:
-        """获取所有已注册的配置实例"""
+    def _reload_loaded(self, config_class: Type[T], raw_config: str) -> T:
+        """
+        使用已获取的原始内容重新构建配置实例（调用方需持有该配置类的锁）
+        
+        Args:
+            config_class: 配置类型
+            raw_config: 从配置源获取的原始配置内容
+            
+        Returns:
+            更新后的配置实例
+        """
+        metadata = self._registered_configs[config_class]
+        data_id = metadata['data_id']
+        group = metadata['group']
+        try:
+            config_instance = self._build_config_instance(
+                config_class, raw_config, self._provider.resolve_data_id(data_id, group),
+                trusted=self._trust_reload
+            )
+            
+            self._store.set_config(config_instance)
+            logger.info(f"重新加载配置: {config_class.__name__}")
+            return config_instance
+            
+        except ValidationError as e:
+            logger.error(f"重新加载配置失败: {config_class.__name__}, 错误: {e}")
+            raise ConfigValidationError(f"{group}/{data_id}", str(e))
+        except Exception as e:
+            logger.error(f"重新加载配置失败: {config_class.__name__}, 错误: {e}")
+            raise
+    
+    def get_all_configs(self) -> Mapping[str, Any]:
+        """获取所有已注册的配置实例（只读映射）"""
         return self._store.get_all_configs()
     
     def get_manager_info(self) -> Dict[str, Any]:
         """
         获取管理器状态信息
         
+        状态信息只在注册、取消注册和关闭时变化，因此结果会被缓存。
+        `config_names` 为不可变的元组，提供者信息每次返回副本，
+        调用方修改返回结果不会影响之后的调用。
+        
         Returns:
             包含提供者信息、注册配置数量等的状态字典
         """
-        return {
-            'provider': self._provider.get_provider_info(),
-            'registered_configs': len(self._registered_configs),
-            'config_names': [cls.__name__ for cls in self._registered_configs.keys()],
-            'store_config_count': self._store.get_config_count()
-        }
+        with self._meta_lock:
+            if self._info_cache is None:
+                self._info_cache = {
+                    'provider': self._provider.get_provider_info(),
+                    'registered_configs': len(self._registered_configs),
+                    'config_names': tuple(cls.__name__ for cls in self._registered_configs.keys()),
+                    'store_config_count': self._store.get_config_count()
+                }
+            return {**self._info_cache, 'provider': copy.deepcopy(self._info_cache['provider'])}
+    
+    def wait_for_change(self, timeout: Optional[float] = None) -> bool:
+        """
+        阻塞等待任一已注册配置因配置源变更而更新
+        
+        等待期间不占用 CPU，配置更新后立即返回。返回后事件被重置，
+        下一次调用将等待后续的变更。管理器关闭时会唤醒所有等待者，
+        关闭之后的调用立即返回。
+        
+        Args:
+            timeout: 最长等待时间（秒），None 表示一直等待
+            
+        Returns:
+            True 如果在超时前有配置被更新；超时或管理器已关闭时返回 False
+        """
+        if self._closed:
+            return False
+        changed = self._change_event.wait(timeout)
+        if self._closed:
+            return False
+        if changed:
+            self._change_event.clear()
+        return changed
     
     def close(self) -> None:
         """
         关闭管理器，断开连接并清理资源。此操作是幂等的。
         """
-        with self._lock:
+        with self._meta_lock:
             # 如果已经关闭，则不执行任何操作
             if self._closed:
                 logger.info("管理器已关闭，无需重复操作")
                 return
+            registered = list(self._registered_configs.items())
+
+        # 停止所有监听器。此时不持有 _meta_lock：unregister 等方法先取类锁再取 _meta_lock，
+        # 这里必须保持相同的加锁顺序，否则会与它们互相等待
+        for config_class, metadata in registered:
+            with self._class_lock(config_class):
+                if config_class in self._registered_configs:
+                    self._provider.unwatch_config(metadata['data_id'], metadata['group'])
+
+        with self._meta_lock:
+            if self._closed:
+                return
 
-            # 停止所有监听器
-            for config_class, metadata in list(self._registered_configs.items()):
-                self._provider.unwatch_config(metadata['data_id'], metadata['group'])
-            
             # 断开提供者连接
             if self._provider and self._provider.is_connected():
                 self._provider.disconnect()
             
             # 清空存储并标记为已关闭
             self._store.clear()
+            self._instance_cache.clear()
             self._registered_configs.clear()
+            self._class_locks.clear()
+            self._info_cache = None
             self._closed = True
+            # 唤醒阻塞在 wait_for_change 中的线程
+            self._change_event.set()
+            self._notify_change_listeners()
             
             logger.info("管理器已成功关闭")
     
     def _start_watching(self, config_class: Type, data_id: str, group: str) -> None:
         """开始监听配置变更"""
-        def on_config_change(new_content: str):
-            """配置变更回调"""
-            try:
-                config_data = self._parse_config_content(new_content, data_id)
-                new_instance = config_class(**config_data)
-                self._store.set_config(new_instance)
-                logger.info(f"配置已更新: {config_class.__name__}")
-            except Exception as e:
-                logger.error(f"处理配置变更时出错: {config_class.__name__}, 错误: {e}")
+        callback = functools.partial(
+            _dispatch_change, weakref.ref(self), config_class,
+            self._provider.resolve_data_id(data_id, group)
+        )
+        self._provider.watch_config(data_id, group, callback)
+    
+    def _apply_config_change(self, config_class: Type, new_content: str, data_id: str) -> None:
+        """根据变更后的内容更新配置实例（调用方需持有该配置类的锁）"""
+        if config_class not in self._registered_configs:
+            # 变更通知到达前配置已被取消注册
+            return
+        
+        new_instance = self._build_config_instance(
+            config_class, new_content, data_id, trusted=self._trust_reload
+        )
+        if self._store.has_config(config_class) and self._store.get_config(config_class) is new_instance:
+            # 内容未变化，复用了当前实例
+            return
         
-        self._provider.watch_config(data_id, group, on_config_change)
+        self._store.set_config(new_instance)
+        self._change_event.set()
+        self._notify_change_listeners()
+        logger.info(f"配置已更新: {config_class.__name__}")
     
     def __enter__(self):
         """上下文管理器支持"""
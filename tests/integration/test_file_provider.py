@@ -8,11 +8,13 @@ YAI Nexus Configuration - 端到端集成测试
 包括配置注册、获取、文件变更和自动更新，不使用任何 mock。
 """
 
+import logging
+import os
 import pytest
 import time
 import json
 import yaml
-import shutil
+import threading
 from pathlib import Path
 
 from yai_nexus_configuration import (
@@ -21,6 +23,11 @@ from yai_nexus_configuration import (
     nexus_config,
     ConfigNotRegisteredError
 )
+from yai_nexus_configuration.internal.providers import FileProvider
+from yai_nexus_configuration.internal.providers import file as file_provider_module
+
+# 测试过程的说明信息，使用 pytest --log-cli-level=DEBUG 查看
+log = logging.getLogger(__name__)
 
 
 # 测试用的配置类
@@ -39,32 +46,38 @@ class RedisConfig(NexusConfig):
     db: int = 0
 
 
+def _recording_callback():
+    """创建记录变更内容的回调，回调被调用时设置事件，测试无需固定时长的 sleep"""
+    changes = []
+    changed = threading.Event()
+    
+    def callback(content: str) -> None:
+        changes.append(content)
+        changed.set()
+    
+    return changes, changed, callback
+
+
 @pytest.fixture
 def config_workspace(tmp_path: Path) -> Path:
     """
     创建一个临时的配置工作区。
-    现在它将在项目根目录下创建 .test_workspace/，并在测试后清理。
+    工作区位于 pytest 的 tmp_path 下，每个测试（包括 pytest-xdist 的各个 worker）互不干扰，
+    由 pytest 负责清理，最近几次运行的目录会被保留以便调试。
     """
-    print("\n--- [Fixture Setup] 开始创建项目内临时配置工作区 ---")
+    log.debug("--- [Fixture Setup] 开始创建临时配置工作区 ---")
     
-    # 获取项目根目录，并创建 .test_workspace 目录
-    project_root = Path(__file__).parent.parent
-    workspace = project_root / ".test_workspace"
-    
-    # 如果目录已存在，先清理
-    if workspace.exists():
-        shutil.rmtree(workspace)
-    workspace.mkdir(parents=True)
-    
-    print(f"  工作区路径: {workspace}")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    log.debug("  工作区路径: %s", workspace)
     
     # 创建配置文件
     prod_dir = workspace / "prod"
     cache_dir = workspace / "cache"
     prod_dir.mkdir(parents=True)
     cache_dir.mkdir(parents=True)
-    print(f"  创建目录: {prod_dir}")
-    print(f"  创建目录: {cache_dir}")
+    log.debug("  创建目录: %s", prod_dir)
+    log.debug("  创建目录: %s", cache_dir)
     
     # 数据库配置 (JSON)
     db_config = {
@@ -75,7 +88,7 @@ def config_workspace(tmp_path: Path) -> Path:
     }
     db_file = prod_dir / "database.json"
     db_file.write_text(json.dumps(db_config, indent=2))
-    print(f"  创建文件: {db_file}")
+    log.debug("  创建文件: %s", db_file)
     
     # Redis 配置 (YAML)
     redis_config = {
@@ -85,58 +98,49 @@ def config_workspace(tmp_path: Path) -> Path:
     }
     redis_file = cache_dir / "redis.yaml"
     redis_file.write_text(yaml.dump(redis_config))
-    print(f"  创建文件: {redis_file}")
+    log.debug("  创建文件: %s", redis_file)
     
-    print("--- [Fixture Setup] 工作区创建完成 ---")
+    log.debug("--- [Fixture Setup] 工作区创建完成 ---")
     
-    yield workspace
-    
-    # --- Fixture Teardown ---
-    print("\n--- [Fixture Teardown] 开始处理临时配置工作区 ---")
-    # 根据用户要求，不再删除工作区，以便于调试和检查
-    # if workspace.exists():
-    #     shutil.rmtree(workspace)
-    #     print(f"  已删除工作区: {workspace}")
-    print(f"  工作区已保留: {workspace}")
-    print("--- [Fixture Teardown] 处理完成 ---")
+    return workspace
 
 
 def test_complete_configuration_workflow(config_workspace: Path):
     """测试完整的配置管理工作流程"""
-    print("\n--- 开始完整的配置工作流测试 ---")
+    log.debug("--- 开始完整的配置工作流测试 ---")
     
     # 1. 创建管理器
-    print("步骤 1: 使用文件提供者创建管理器...")
+    log.debug("步骤 1: 使用文件提供者创建管理器...")
     manager = NexusConfigManager.with_file(
         base_path=config_workspace,
         watch_interval=0.1  # 快速监听，加速测试
     )
-    print("管理器创建成功。")
+    log.debug("管理器创建成功。")
     
     # 2. 注册配置
-    print("\n步骤 2: 注册 DatabaseConfig 和 RedisConfig...")
+    log.debug("步骤 2: 注册 DatabaseConfig 和 RedisConfig...")
     manager.register(DatabaseConfig)
     manager.register(RedisConfig)
-    print("配置注册完成。")
+    log.debug("配置注册完成。")
     
     # 3. 获取配置并验证初始值
-    print("\n步骤 3: 获取并验证初始配置...")
+    log.debug("步骤 3: 获取并验证初始配置...")
     db_config = manager.get_config(DatabaseConfig)
-    print(f"  获取到 DatabaseConfig: host={db_config.host}, port={db_config.port}")
+    log.debug("  获取到 DatabaseConfig: host=%s, port=%s", db_config.host, db_config.port)
     assert db_config.host == "db.example.com"
     assert db_config.port == 5432
     assert db_config.username == "admin"
     assert db_config.password == "secret123"
     
     redis_config = manager.get_config(RedisConfig)
-    print(f"  获取到 RedisConfig: host={redis_config.host}, db={redis_config.db}")
+    log.debug("  获取到 RedisConfig: host=%s, db=%s", redis_config.host, redis_config.db)
     assert redis_config.host == "redis.example.com"
     assert redis_config.port == 6379
     assert redis_config.db == 0
-    print("初始配置验证成功。")
+    log.debug("初始配置验证成功。")
     
     # 4. 修改文件内容，测试自动更新
-    print("\n步骤 4: 修改 database.json 文件内容...")
+    log.debug("步骤 4: 修改 database.json 文件内容...")
     new_db_config = {
         "host": "new-db.example.com",
         "port": 3306,
@@ -146,43 +150,43 @@ def test_complete_configuration_workflow(config_workspace: Path):
     
     db_file = config_workspace / "prod" / "database.json"
     db_file.write_text(json.dumps(new_db_config, indent=2))
-    print("文件已修改，等待监听器响应...")
+    log.debug("文件已修改，等待监听器响应...")
     
-    # 等待文件监听器检测到变更
-    time.sleep(0.3)
+    # 等待文件监听器检测到变更（更新完成后立即返回）
+    assert manager.wait_for_change(timeout=2.0)
     
     # 5. 验证配置已自动更新
-    print("\n步骤 5: 验证配置已自动更新...")
+    log.debug("步骤 5: 验证配置已自动更新...")
     updated_db_config = manager.get_config(DatabaseConfig)
-    print(f"  获取到更新后的 DatabaseConfig: host={updated_db_config.host}, port={updated_db_config.port}")
+    log.debug("  获取到更新后的 DatabaseConfig: host=%s, port=%s", updated_db_config.host, updated_db_config.port)
     assert updated_db_config.host == "new-db.example.com"
     assert updated_db_config.port == 3306
     assert updated_db_config.username == "root"
     assert updated_db_config.password == "newpassword"
-    print("数据库配置更新验证成功。")
+    log.debug("数据库配置更新验证成功。")
     
     # Redis 配置应该保持不变
     redis_config_after = manager.get_config(RedisConfig)
     assert redis_config_after.host == "redis.example.com"
-    print("Redis 配置保持不变验证成功。")
+    log.debug("Redis 配置保持不变验证成功。")
     
     # 6. 测试注销配置
-    print("\n步骤 6: 注销 DatabaseConfig...")
+    log.debug("步骤 6: 注销 DatabaseConfig...")
     assert manager.unregister(DatabaseConfig) is True
     with pytest.raises(ConfigNotRegisteredError):
         manager.get_config(DatabaseConfig)
-    print("DatabaseConfig 注销并访问失败，验证成功。")
+    log.debug("DatabaseConfig 注销并访问失败，验证成功。")
     
     # Redis 配置应该仍然可用
     redis_config_final = manager.get_config(RedisConfig)
     assert redis_config_final.host == "redis.example.com"
-    print("Redis 配置在注销其他配置后依然可用。")
+    log.debug("Redis 配置在注销其他配置后依然可用。")
     
     # 7. 清理
-    print("\n步骤 7: 关闭管理器...")
+    log.debug("步骤 7: 关闭管理器...")
     manager.close()
-    print("管理器已关闭。")
-    print("--- 测试结束 ---")
+    log.debug("管理器已关闭。")
+    log.debug("--- 测试结束 ---")
 
 
 def test_manager_info_and_statistics(config_workspace: Path):
@@ -193,7 +197,7 @@ def test_manager_info_and_statistics(config_workspace: Path):
     # 初始状态
     info = manager.get_manager_info()
     assert info['registered_configs'] == 0
-    assert info['config_names'] == []
+    assert info['config_names'] == ()
     assert info['store_config_count'] == 0
     
     # 注册配置后
@@ -268,11 +272,194 @@ def test_multiple_file_changes(config_workspace: Path):
         }
         
         db_file.write_text(json.dumps(updated_config, indent=2))
-        time.sleep(0.2)  # 给监听器时间处理更新
+        assert manager.wait_for_change(timeout=2.0)  # 等待监听器处理更新
         
         # 验证配置已更新
         current_config = manager.get_config(DatabaseConfig)
         assert current_config.host == f"host-{i}.example.com"
         assert current_config.port == 5432 + i
     
-    manager.close() 
\ No newline at end of file
+    manager.close() 
+
+def test_file_provider_content_cache(tmp_path: Path):
+    """测试文件未变更时 FileProvider 复用缓存内容，变更后重新读取"""
+    unrelated = tmp_path / "OTHER_GROUP" / "unused.json"
+    unrelated.parent.mkdir(parents=True)
+    unrelated.write_text('{"name": "unused"}')
+    
+    provider = FileProvider(base_path=tmp_path)
+    provider.connect()
+    # 连接时不遍历配置目录，只有被请求的文件才会被读取和缓存
+    assert provider._content_cache == {}
+    
+    config_file = tmp_path / "DEFAULT_GROUP" / "app.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text('{"name": "v1"}')
+    
+    first = provider.get_config("app.json", "DEFAULT_GROUP")
+    second = provider.get_config("app.json", "DEFAULT_GROUP")
+    assert first == '{"name": "v1"}'
+    assert second is first
+    
+    config_file.write_text('{"name": "v2-changed"}')
+    assert provider.get_config("app.json", "DEFAULT_GROUP") == '{"name": "v2-changed"}'
+    
+    # 取消监听后不再保留该文件的缓存内容
+    provider.watch_config("app.json", "DEFAULT_GROUP", lambda content: None)
+    provider.unwatch_config("app.json", "DEFAULT_GROUP")
+    assert provider._content_cache == {}
+    
+    provider.get_config("app.json", "DEFAULT_GROUP")
+    provider.disconnect()
+    assert provider._content_cache == {}
+
+
+def test_file_provider_forced_polling(tmp_path: Path):
+    """测试 use_polling=True 时使用轮询线程监听文件变更"""
+    config_file = tmp_path / "DEFAULT_GROUP" / "app.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text('{"name": "v1"}')
+    
+    provider = FileProvider(base_path=tmp_path, watch_interval=0.05, use_polling=True)
+    provider.connect()
+    assert provider._observer is None
+    
+    changes, changed, callback = _recording_callback()
+    provider.watch_config("app.json", "DEFAULT_GROUP", callback)
+    config_file.write_text('{"name": "v2-changed"}')
+    assert changed.wait(timeout=2.0)
+    
+    assert changes == ['{"name": "v2-changed"}']
+    provider.disconnect()
+
+
+def test_network_filesystem_detection_handles_escaped_mount_points(tmp_path: Path, monkeypatch):
+    """测试挂载点含八进制转义、非 ASCII 字符或非法 UTF-8 字节时仍能正确解析"""
+    config_dir = tmp_path / "网络 配置"
+    config_dir.mkdir()
+    mount_point = os.fsencode(config_dir).replace(b" ", b"\\040")
+    mounts_file = tmp_path / "mounts"
+    mounts_file.write_bytes(
+        b"/dev/sda1 / ext4 rw 0 0\n"
+        b"server:/bad /mnt/\xff\xfe nfs rw 0 0\n"
+        b"server:/export " + mount_point + b" nfs4 rw 0 0\n"
+    )
+    monkeypatch.setattr(file_provider_module, "_MOUNTS_FILE", str(mounts_file))
+    
+    assert file_provider_module._is_network_filesystem(config_dir)
+    assert not file_provider_module._is_network_filesystem(tmp_path)
+    
+    monkeypatch.setattr(file_provider_module, "_MOUNTS_FILE", str(tmp_path / "missing"))
+    assert not file_provider_module._is_network_filesystem(config_dir)
+
+
+@pytest.mark.skipif(not file_provider_module.HAS_WATCHDOG, reason="需要安装 watchdog")
+def test_file_provider_debounces_event_bursts(tmp_path: Path):
+    """测试短时间内的多次写入只触发一次回调"""
+    config_file = tmp_path / "DEFAULT_GROUP" / "app.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text('{"name": "v0"}')
+    
+    provider = FileProvider(base_path=tmp_path, debounce_interval=0.1)
+    provider.connect()
+    
+    changes = []
+    provider.watch_config("app.json", "DEFAULT_GROUP", changes.append)
+    for i in range(1, 4):
+        config_file.write_text(f'{{"name": "v{i}"}}')
+    time.sleep(0.5)
+    
+    assert changes == ['{"name": "v3"}']
+    provider.disconnect()
+
+
+@pytest.mark.skipif(not file_provider_module.HAS_WATCHDOG, reason="需要安装 watchdog")
+def test_file_provider_observes_only_watched_directories(tmp_path: Path):
+    """测试 watchdog 只订阅被监听文件所在的目录，目录尚不存在时订阅上级目录"""
+    (tmp_path / "DEFAULT_GROUP").mkdir()
+    (tmp_path / "OTHER_GROUP").mkdir()
+    
+    provider = FileProvider(base_path=tmp_path, debounce_interval=0.05)
+    provider.connect()
+    
+    changes, changed, callback = _recording_callback()
+    provider.watch_config("app.json", "DEFAULT_GROUP", callback)
+    provider.watch_config("later.json", "NEW_GROUP", callback)
+    assert provider._observed_dirs.keys() == {
+        str(tmp_path / "DEFAULT_GROUP"), str(tmp_path)
+    }
+    
+    # 监听时目录尚不存在的配置，之后创建的文件仍能被发现
+    new_file = tmp_path / "NEW_GROUP" / "later.json"
+    new_file.parent.mkdir()
+    new_file.write_text('{"name": "later"}')
+    assert changed.wait(timeout=2.0)
+    assert changes == ['{"name": "later"}']
+    
+    provider.unwatch_config("app.json", "DEFAULT_GROUP")
+    assert str(tmp_path / "DEFAULT_GROUP") not in provider._observed_dirs
+    provider.disconnect()
+
+
+def test_file_provider_ignores_touch_without_content_change(tmp_path: Path):
+    """测试只更新 mtime 而内容不变时不触发回调"""
+    config_file = tmp_path / "DEFAULT_GROUP" / "app.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text('{"name": "v1"}')
+    
+    provider = FileProvider(base_path=tmp_path, watch_interval=0.05, use_polling=True)
+    provider.connect()
+    
+    changes = []
+    provider.watch_config("app.json", "DEFAULT_GROUP", changes.append)
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    time.sleep(0.3)
+    
+    assert changes == []
+    provider.disconnect()
+
+
+def test_file_provider_prefers_default_format_for_data_id_without_suffix(tmp_path: Path):
+    """测试 data_id 没有扩展名时优先使用默认格式的文件，其次是已存在的 JSON 文件"""
+    group_dir = tmp_path / "DEFAULT_GROUP"
+    group_dir.mkdir(parents=True)
+    (group_dir / "app.yaml").write_text("name: from-yaml")
+    
+    provider = FileProvider(base_path=tmp_path)
+    provider.connect()
+    assert provider.get_config("app", "DEFAULT_GROUP") == "name: from-yaml"
+    assert provider.resolve_data_id("app", "DEFAULT_GROUP") == "app.yaml"
+    provider.disconnect()
+    
+    (group_dir / "app.json").write_text('{"name": "from-json"}')
+    provider.connect()
+    assert provider.get_config("app", "DEFAULT_GROUP") == '{"name": "from-json"}'
+    provider.disconnect()
+    
+    provider = FileProvider(base_path=tmp_path, default_format="yaml")
+    provider.connect()
+    assert provider.get_config("app", "DEFAULT_GROUP") == "name: from-yaml"
+    provider.disconnect()
+
+
+def test_manager_parses_file_resolved_for_data_id_without_suffix(tmp_path: Path):
+    """测试 data_id 没有扩展名时，管理器按实际找到的文件选择解析器"""
+    
+    @nexus_config(data_id="app", group="DEFAULT_GROUP")
+    class SuffixlessConfig(NexusConfig):
+        name: str
+    
+    config_file = tmp_path / "DEFAULT_GROUP" / "app.yaml"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text("name: from-yaml")
+    
+    manager = NexusConfigManager.with_file(base_path=tmp_path)
+    try:
+        manager.register(SuffixlessConfig)
+        assert manager.get_config(SuffixlessConfig).name == "from-yaml"
+        
+        config_file.write_text("name: reloaded")
+        assert manager.reload_config(SuffixlessConfig).name == "reloaded"
+    finally:
+        manager.close()
\ No newline at end of file
@@ -8,6 +8,7 @@ YAI Nexus Configuration - Nacos Provider 集成测试
 这个测试需要一个正在运行的 Nacos 实例，并通过环境变量进行配置。
 """
 
+import logging
 import pytest
 import os
 import json
@@ -19,6 +20,9 @@ from yai_nexus_configuration import (
     nexus_config,
 )
 
+# 测试过程的说明信息，使用 pytest --log-cli-level=DEBUG 查看
+log = logging.getLogger(__name__)
+
 # --- 从环境变量获取 Nacos 配置 ---
 # 您提供的服务器地址将通过环境变量传入
 NACOS_SERVER_ADDR = os.environ.get("NACOS_SERVER_ADDR")
@@ -29,6 +33,18 @@ NACOS_NAMESPACE = os.environ.get("NACOS_NAMESPACE", "")
 NACOS_USERNAME = os.environ.get("NACOS_USERNAME")
 NACOS_PASSWORD = os.environ.get("NACOS_PASSWORD")
 
+# 连接参数在导入时计算一次，去掉值为 None 的参数
+NACOS_CONNECTION_ARGS = {
+    key: value
+    for key, value in {
+        "server_addresses": NACOS_SERVER_ADDR,
+        "namespace": NACOS_NAMESPACE,
+        "username": NACOS_USERNAME,
+        "password": NACOS_PASSWORD,
+    }.items()
+    if value is not None
+}
+
 # --- 测试用的 Data ID 和预期的配置内容 ---
 JSON_TEST_DATA_ID = "yai-nexus-configuration-json-test-1.json"
 YAML_TEST_DATA_ID = "yai-nexus-configuration-yaml-test-1.yaml"
@@ -77,24 +93,17 @@ def nacos_connection_args():
     if not NACOS_SERVER_ADDR:
         pytest.skip("Nacos server address not configured.")
 
-    print(f"\n--- [Nacos Test Setup] ---")
-    print(f"  服务器: {NACOS_SERVER_ADDR}")
-    print(f"  命名空间: {NACOS_NAMESPACE or 'public'}")
-    print(f"  用户: {NACOS_USERNAME or '未设置'}")
-    print(f"  分组: {NACOS_GROUP}")
-    print(f"  测试 JSON Data ID: {JSON_TEST_DATA_ID}")
-    print(f"  测试 YAML Data ID: {YAML_TEST_DATA_ID}")
-    print(f"--- [Nacos Test Setup] ---")
+    log.debug("--- [Nacos Test Setup] ---")
+    log.debug("  服务器: %s", NACOS_SERVER_ADDR)
+    log.debug("  命名空间: %s", NACOS_NAMESPACE or 'public')
+    log.debug("  用户: %s", NACOS_USERNAME or '未设置')
+    log.debug("  分组: %s", NACOS_GROUP)
+    log.debug("  测试 JSON Data ID: %s", JSON_TEST_DATA_ID)
+    log.debug("  测试 YAML Data ID: %s", YAML_TEST_DATA_ID)
+    log.debug("--- [Nacos Test Setup] ---")
 
-    connection_args = {
-        "server_addresses": NACOS_SERVER_ADDR,
-        "namespace": NACOS_NAMESPACE,
-        "username": NACOS_USERNAME,
-        "password": NACOS_PASSWORD
-    }
-    
-    # 清理掉值为 None 的参数
-    return {k: v for k, v in connection_args.items() if v is not None}
+    # 返回副本，避免测试修改模块级常量
+    return dict(NACOS_CONNECTION_ARGS)
 
 
 @requires_nacos
@@ -107,37 +116,37 @@ def test_nacos_config_retrieval(nacos_connection_args):
     2. 注册 JSON 和 YAML 两个配置类。
     3. 获取配置并分别验证其内容是否正确。
     """
-    print("\n--- 开始 Nacos 配置获取测试 (JSON & YAML) ---")
+    log.debug("--- 开始 Nacos 配置获取测试 (JSON & YAML) ---")
 
     # 1. 使用 Nacos 提供者创建管理器
-    print("步骤 1: 使用 Nacos 提供者创建管理器...")
+    log.debug("步骤 1: 使用 Nacos 提供者创建管理器...")
     manager = NexusConfigManager.with_nacos(**nacos_connection_args)
-    print("  管理器创建成功。")
+    log.debug("  管理器创建成功。")
 
     # 2. 注册配置
-    print(f"\n步骤 2: 注册 NacosJsonTestConfig 和 NacosYamlTestConfig...")
+    log.debug("步骤 2: 注册 NacosJsonTestConfig 和 NacosYamlTestConfig...")
     manager.register(NacosJsonTestConfig)
     manager.register(NacosYamlTestConfig)
-    print("  配置注册完成。")
+    log.debug("  配置注册完成。")
 
     # 3. 获取并验证
-    print("\n步骤 3: 获取并验证配置...")
+    log.debug("步骤 3: 获取并验证配置...")
     try:
         # 验证 JSON 配置
         json_config = manager.get_config(NacosJsonTestConfig)
-        print(f"  成功获取 JSON 配置: app_name='{json_config.app_name}', version='{json_config.version}'")
+        log.debug("  成功获取 JSON 配置: app_name='%s', version='%s'", json_config.app_name, json_config.version)
         assert json_config.app_name == EXPECTED_JSON_CONFIG["app_name"]
         assert json_config.version == EXPECTED_JSON_CONFIG["version"]
         assert json_config.enabled == EXPECTED_JSON_CONFIG["enabled"]
-        print("  JSON 配置内容验证成功。")
+        log.debug("  JSON 配置内容验证成功。")
         
         # 验证 YAML 配置
         yaml_config = manager.get_config(NacosYamlTestConfig)
-        print(f"  成功获取 YAML 配置: server.host='{yaml_config.server.host}', retries={yaml_config.retries}")
+        log.debug("  成功获取 YAML 配置: server.host='%s', retries=%s", yaml_config.server.host, yaml_config.retries)
         assert yaml_config.server.host == EXPECTED_YAML_CONFIG["server"]["host"]
         assert yaml_config.server.port == EXPECTED_YAML_CONFIG["server"]["port"]
         assert yaml_config.retries == EXPECTED_YAML_CONFIG["retries"]
-        print("  YAML 配置内容验证成功。")
+        log.debug("  YAML 配置内容验证成功。")
 
     except Exception as e:
         pytest.fail(
@@ -156,7 +165,7 @@ def test_nacos_config_retrieval(nacos_connection_args):
         )
     finally:
         # 4. 清理
-        print("\n步骤 4: 关闭管理器...")
+        log.debug("步骤 4: 关闭管理器...")
         manager.close()
-        print("  管理器已关闭。")
-        print("--- Nacos 配置获取测试结束 ---") 
\ No newline at end of file
+        log.debug("  管理器已关闭。")
+        log.debug("--- Nacos 配置获取测试结束 ---") 
\ No newline at end of file
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YAI Nexus Configuration - 单元测试 - 异步管理器
+
+测试 NexusConfigManagerAsync 的注册、重新加载和关闭流程。
+"""
+
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from yai_nexus_configuration import (
+    NexusConfigManager,
+    NexusConfigManagerAsync,
+    NexusConfig,
+    nexus_config,
+    ConfigNotRegisteredError,
+    MissingConfigMetadataError,
+    ProviderConnectionError,
+)
+from yai_nexus_configuration.internal.providers import AbstractProvider
+
+
+@nexus_config(data_id="app.json", group="test_group")
+class AppConfig(NexusConfig):
+    name: str
+
+
+@nexus_config(data_id="db.json", group="test_group")
+class DbConfig(NexusConfig):
+    host: str
+
+
+class UndecoratedConfig(NexusConfig):
+    value: str
+
+
+CONTENTS = {
+    ("app.json", "test_group"): '{"name": "demo"}',
+    ("db.json", "test_group"): '{"host": "db.local"}',
+}
+
+
+@pytest.fixture
+def mock_provider() -> MagicMock:
+    """提供一个 aget_config 按 (data_id, group) 返回内容的模拟 Provider。"""
+    provider = MagicMock(spec=AbstractProvider)
+
+    async def aget_config(data_id, group):
+        return CONTENTS[(data_id, group)]
+
+    provider.aget_config.side_effect = aget_config
+    # 与 AbstractProvider 的默认实现一致，原样返回 data_id
+    provider.resolve_data_id.side_effect = lambda data_id, group: data_id
+    return provider
+
+
+@pytest.fixture
+def manager(mock_provider: MagicMock) -> NexusConfigManagerAsync:
+    """提供一个使用模拟 Provider 的异步管理器。"""
+    with patch.object(AbstractProvider, 'connect'):
+        return NexusConfigManagerAsync(NexusConfigManager(provider=mock_provider))
+
+
+def test_register_many_and_get_config(manager: NexusConfigManagerAsync, mock_provider: MagicMock):
+    """测试并发注册多个配置类，配置内容通过 aget_config 获取。"""
+    asyncio.run(manager.register_many([AppConfig, DbConfig]))
+
+    assert manager.get_config(AppConfig).name == "demo"
+    assert manager.get_config(DbConfig).host == "db.local"
+    assert mock_provider.aget_config.call_count == 2
+    mock_provider.get_config.assert_not_called()
+    assert mock_provider.watch_config.call_count == 2
+
+
+def test_post_fetch_steps_run_off_event_loop(manager: NexusConfigManagerAsync, mock_provider: MagicMock):
+    """测试获取内容之后的验证、监听和取消监听不在事件循环线程中执行。"""
+    threads = []
+    mock_provider.watch_config.side_effect = lambda *args: threads.append(threading.current_thread())
+    mock_provider.unwatch_config.side_effect = lambda *args: threads.append(threading.current_thread())
+
+    async def scenario():
+        await manager.register(AppConfig)
+        assert await manager.unregister(AppConfig) is True
+
+    asyncio.run(scenario())
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_register_many_with_undecorated_registers_nothing(manager: NexusConfigManagerAsync, mock_provider: MagicMock):
+    """测试包含未装饰的配置类时不会注册任何配置。"""
+    with pytest.raises(MissingConfigMetadataError):
+        asyncio.run(manager.register_many([AppConfig, UndecoratedConfig]))
+
+    mock_provider.aget_config.assert_not_called()
+
+
+def test_reload_config(manager: NexusConfigManagerAsync):
+    """测试 reload_config 异步获取新内容并更新配置实例。"""
+    async def scenario():
+        await manager.register(AppConfig)
+        with pytest.raises(ConfigNotRegisteredError):
+            await manager.reload_config(DbConfig)
+
+        CONTENTS[("app.json", "test_group")] = '{"name": "updated"}'
+        try:
+            return await manager.reload_config(AppConfig)
+        finally:
+            CONTENTS[("app.json", "test_group")] = '{"name": "demo"}'
+
+    reloaded = asyncio.run(scenario())
+    assert reloaded.name == "updated"
+    assert manager.get_config(AppConfig) is reloaded
+
+
+def test_async_context_manager_closes(mock_provider: MagicMock):
+    """测试异步上下文管理器退出时关闭底层管理器。"""
+    async def scenario():
+        with patch.object(AbstractProvider, 'connect'):
+            manager = NexusConfigManagerAsync(NexusConfigManager(provider=mock_provider))
+        async with manager:
+            await manager.register(AppConfig)
+        return manager
+
+    manager = asyncio.run(scenario())
+    mock_provider.unwatch_config.assert_called_once_with("app.json", "test_group")
+    with pytest.raises(ConfigNotRegisteredError):
+        manager.get_config(AppConfig)
+
+
+def test_wait_for_change_is_notified_from_watcher_thread(manager: NexusConfigManagerAsync, mock_provider: MagicMock):
+    """测试 Provider 监听线程中的配置变更会唤醒异步等待者。"""
+    async def scenario():
+        await manager.register(AppConfig)
+        callback = mock_provider.watch_config.call_args.args[2]
+        assert await manager.wait_for_change(timeout=0) is False
+
+        threading.Timer(0.05, callback, args=('{"name": "changed"}',)).start()
+        assert await manager.wait_for_change(timeout=2.0) is True
+        assert await manager.wait_for_change(timeout=0) is False
+        await manager.close()
+
+    asyncio.run(scenario())
+
+
+def test_close_wakes_waiters_and_leaves_no_threads(manager: NexusConfigManagerAsync):
+    """测试取消等待后关闭管理器不会挂起，关闭会唤醒仍在等待的协程。"""
+    async def scenario():
+        await manager.register(AppConfig)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(manager.wait_for_change(), 0.1)
+
+        waiter = asyncio.ensure_future(manager.wait_for_change())
+        await asyncio.sleep(0.05)
+        await manager.close()
+        return [await asyncio.wait_for(waiter, 1.0), await manager.wait_for_change()]
+
+    # 等待线程未被唤醒时 asyncio.run 会在关闭默认线程池时挂起，因此在独立线程中运行并设置超时
+    results = []
+    runner = threading.Thread(target=lambda: results.append(asyncio.run(scenario())), daemon=True)
+    runner.start()
+    runner.join(timeout=5.0)
+    assert not runner.is_alive()
+    assert results == [[False, False]]
+
+
+def test_register_without_provider_fails():
+    """测试底层管理器没有 Provider 时注册抛出 ProviderConnectionError，而不是 AttributeError。"""
+    with pytest.warns(DeprecationWarning):
+        manager = NexusConfigManagerAsync(NexusConfigManager())
+
+    with pytest.raises(ProviderConnectionError):
+        asyncio.run(manager.register(AppConfig))
@@ -7,8 +7,13 @@ YAI Nexus Configuration - 单元测试 - 配置模型
 测试 NexusConfig 基础模型的功能。
 """
 
+import gc
+import json
+import weakref
+from typing import Dict, List
+
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError, computed_field
 
 from yai_nexus_configuration import NexusConfig, nexus_config
 
@@ -34,8 +39,8 @@ def test_nexus_config_basic_validation():
         ServerConfig(host="localhost", port="not-a-number")  # port must be an int
 
 
-def test_nexus_config_assignment_validation():
-    """测试在字段赋值时进行验证"""
+def test_nexus_config_is_frozen():
+    """测试配置实例是只读的，且可以被哈希"""
 
     class DatabaseConfig(NexusConfig):
         host: str
@@ -43,13 +48,13 @@ def test_nexus_config_assignment_validation():
 
     config = DatabaseConfig(host="db", port=5432)
 
-    # 测试修改合法值
-    config.port = 5433
-    assert config.port == 5433
-
-    # 测试赋给错误类型的值
+    # 测试字段赋值被拒绝
     with pytest.raises(ValidationError):
-        config.port = "not-a-number"
+        config.port = 5433
+    assert config.port == 5432
+
+    # 测试相同内容的实例哈希一致
+    assert hash(config) == hash(DatabaseConfig(host="db", port=5432))
 
 
 def test_nexus_config_decorator_metadata():
@@ -91,4 +96,96 @@ def test_nexus_config_get_summary_hides_sensitive_data():
     assert summary["normal_field"] == "visible"
     assert summary["password"] == "***hidden***"
     assert summary["api_key"] == "***hidden***"
-    assert summary["secret_token"] == "***hidden***" 
\ No newline at end of file
+    assert summary["secret_token"] == "***hidden***"
+
+
+def test_nexus_config_get_summary_with_nested_model():
+    """测试 get_config_summary 会将嵌套模型序列化为字典"""
+
+    class ServerDetails(NexusConfig):
+        host: str
+        port: int
+
+    class ServiceConfig(NexusConfig):
+        server: ServerDetails
+        token: str
+
+    config = ServiceConfig(server=ServerDetails(host="localhost", port=80), token="t")
+
+    summary = config.get_config_summary()
+
+    assert summary["server"] == {"host": "localhost", "port": 80}
+    assert summary["token"] == "***hidden***"
+
+
+def test_nexus_config_get_summary_is_json_serializable():
+    """测试包含模型列表和模型字典字段的摘要可以直接 JSON 序列化"""
+
+    class Endpoint(NexusConfig):
+        url: str
+        weight: int = 1
+
+    class ClusterConfig(NexusConfig):
+        name: str
+        endpoints: List[Endpoint]
+        by_region: Dict[str, Endpoint]
+
+    config = ClusterConfig(
+        name="main",
+        endpoints=[Endpoint(url="http://a"), Endpoint(url="http://b", weight=2)],
+        by_region={"cn": Endpoint(url="http://cn")},
+    )
+
+    summary = config.get_config_summary()
+
+    assert list(summary) == ["name", "endpoints", "by_region"]
+    assert summary["endpoints"] == [{"url": "http://a", "weight": 1}, {"url": "http://b", "weight": 2}]
+    assert summary["by_region"] == {"cn": {"url": "http://cn", "weight": 1}}
+    assert json.loads(json.dumps(summary)) == summary
+
+
+def test_nexus_config_get_summary_matches_model_dump_keys():
+    """测试摘要与 model_dump 包含相同的键：排除的字段被跳过，额外字段和计算字段同样会被屏蔽"""
+
+    class ExtendedConfig(NexusConfig, extra='allow'):
+        host: str
+        internal: str = Field("internal-value", exclude=True)
+        internal_password: str = Field("p", exclude=True)
+
+        @computed_field
+        @property
+        def url(self) -> str:
+            return f"h://{self.host}"
+
+        @computed_field
+        @property
+        def secret_url(self) -> str:
+            return f"h://user:pass@{self.host}"
+
+    config = ExtendedConfig(host="a", other=1, api_token="zzz")
+
+    summary = config.get_config_summary()
+
+    assert list(summary) == list(config.model_dump())
+    assert summary == {
+        "host": "a",
+        "other": 1,
+        "api_token": "***hidden***",
+        "url": "h://a",
+        "secret_url": "***hidden***",
+    }
+
+
+def test_nexus_config_get_summary_does_not_keep_class_alive():
+    """测试 get_config_summary 的按类缓存不会阻止动态创建的配置类被回收"""
+
+    class TenantConfig(NexusConfig):
+        name: str
+
+    assert TenantConfig(name="t").get_config_summary() == {"name": "t"}
+    class_ref = weakref.ref(TenantConfig)
+
+    del TenantConfig
+    gc.collect()
+
+    assert class_ref() is None
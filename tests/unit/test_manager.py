@@ -7,7 +7,13 @@ YAI Nexus Configuration - 单元测试 - 核心管理器
 测试 NexusConfigManager 的核心功能，包括配置生命周期、工厂方法和错误处理。
 """
 
+import gc
+import threading
+import time
+import weakref
+
 import pytest
+from pydantic import model_validator
 from unittest.mock import MagicMock, patch, ANY
 
 from yai_nexus_configuration import (
@@ -18,7 +24,9 @@ from yai_nexus_configuration import (
     MissingConfigMetadataError,
     ConfigValidationError,
 )
+from yai_nexus_configuration.decorator import get_config_metadata
 from yai_nexus_configuration.internal.providers import AbstractProvider
+from yai_nexus_configuration.manager import _declared_input_keys
 
 
 # 用于测试的、被装饰器标记的配置类
@@ -38,6 +46,8 @@ def mock_provider() -> MagicMock:
     provider = MagicMock(spec=AbstractProvider)
     # 模拟从 Provider 获取一个合法的 JSON 配置字符串
     provider.get_config.return_value = '{"host": "test.db", "port": 5432}'
+    # 与 AbstractProvider 的默认实现一致，原样返回 data_id
+    provider.resolve_data_id.side_effect = lambda data_id, group: data_id
     return provider
 
 
@@ -101,6 +111,39 @@ def test_register_already_registered_skips(manager: NexusConfigManager, mock_pro
     assert "已经注册，跳过" in caplog.text
 
 
+def test_register_many_success(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试 register_many 能一次注册多个配置类。"""
+
+    @nexus_config(data_id="other_config.json", group="test_group")
+    class OtherConfig(NexusConfig):
+        host: str
+
+    mock_provider.get_configs.return_value = {
+        ("test_config.json", "test_group"): '{"host": "test.db", "port": 5432}',
+        ("other_config.json", "test_group"): '{"host": "test.db"}',
+    }
+
+    manager.register_many([DecoratedConfig, OtherConfig])
+
+    # 所有配置内容通过一次批量请求获取
+    mock_provider.get_configs.assert_called_once_with(
+        [("test_config.json", "test_group"), ("other_config.json", "test_group")]
+    )
+    mock_provider.get_config.assert_not_called()
+    assert manager.get_config(DecoratedConfig).host == "test.db"
+    assert manager.get_config(OtherConfig).host == "test.db"
+
+
+def test_register_many_with_undecorated_registers_nothing(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试 register_many 在存在未装饰的配置类时不注册任何配置。"""
+    with pytest.raises(MissingConfigMetadataError):
+        manager.register_many([DecoratedConfig, UndecoratedConfig])
+
+    mock_provider.get_configs.assert_not_called()
+    with pytest.raises(ConfigNotRegisteredError):
+        manager.get_config(DecoratedConfig)
+
+
 def test_unregister_config_success(manager: NexusConfigManager, mock_provider: MagicMock):
     """测试一个已注册的配置可以被成功注销。"""
     manager.register(DecoratedConfig)
@@ -123,6 +166,40 @@ def test_unregister_not_registered_config(manager: NexusConfigManager):
     assert unregistered is False
 
 
+def test_manager_info_is_not_corrupted_by_callers(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试修改 get_manager_info 的返回结果不会影响之后的调用。"""
+    mock_provider.get_provider_info.return_value = {'name': 'mock', 'server_addresses': ['a:8848']}
+    manager.register(DecoratedConfig)
+
+    info = manager.get_manager_info()
+    assert info['config_names'] == ('DecoratedConfig',)
+    info['provider']['name'] = 'changed'
+    info['provider']['server_addresses'].append('b:8848')
+    info['registered_configs'] = 99
+
+    info = manager.get_manager_info()
+    assert info['provider'] == {'name': 'mock', 'server_addresses': ['a:8848']}
+    assert info['registered_configs'] == 1
+
+
+def test_manager_info_reflects_watch_registered_during_register(
+    manager: NexusConfigManager, mock_provider: MagicMock
+):
+    """测试注册期间并发调用 get_manager_info 不会让缓存停留在监听注册之前的状态。"""
+    watchers = []
+    mock_provider.get_provider_info.side_effect = lambda: {'watchers_count': len(watchers)}
+
+    def watch_config(data_id, group, callback):
+        # 模拟另一个线程在监听注册完成前读取状态信息
+        manager.get_manager_info()
+        watchers.append(callback)
+
+    mock_provider.watch_config.side_effect = watch_config
+    manager.register(DecoratedConfig)
+
+    assert manager.get_manager_info()['provider']['watchers_count'] == 1
+
+
 @patch('yai_nexus_configuration.manager.NacosProvider')
 def test_with_nacos_factory(MockNacosProvider):
     """测试 with_nacos 工厂方法能创建一个带有 NacosProvider 的管理器。"""
@@ -163,7 +240,8 @@ def test_with_file_factory(MockFileProvider):
         base_path=base_path,
         default_format="json",
         watch_interval=1.0,
-        auto_create_dirs=True
+        auto_create_dirs=True,
+        debounce_interval=0.1
     )
     
     # 断言 manager 的 provider 就是我们模拟的实例
@@ -193,10 +271,131 @@ def test_reload_config_success(manager: NexusConfigManager, mock_provider: Magic
     assert stored_config.host == "new.db"
 
 
+def test_reload_with_invalid_content_raises_config_validation_error(
+    manager: NexusConfigManager, mock_provider: MagicMock
+):
+    """测试重新加载时的字段验证失败同样被转换为 ConfigValidationError，原配置保持不变。"""
+    manager.register(DecoratedConfig)
+    original = manager.get_config(DecoratedConfig)
+
+    mock_provider.get_config.return_value = '{"host": "test.db", "port": "invalid"}'
+    with pytest.raises(ConfigValidationError, match="test_group/test_config.json"):
+        manager.reload_config(DecoratedConfig)
+
+    assert manager.get_config(DecoratedConfig) is original
+
+
+def test_reload_unchanged_content_reuses_instance(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试配置内容未变化时 reload_config 复用已有实例，不重新验证。"""
+    manager.register(DecoratedConfig)
+    original = manager.get_config(DecoratedConfig)
+
+    with patch.object(manager, '_parse_config_content') as mock_parse:
+        reloaded = manager.reload_config(DecoratedConfig)
+
+    mock_parse.assert_not_called()
+    assert reloaded is original
+
+
+def test_reload_with_env_vars_rebuilds_only_when_env_changes(
+    manager: NexusConfigManager, mock_provider: MagicMock, monkeypatch
+):
+    """测试引用环境变量的配置：内容和变量值都未变化时复用实例，变量值变化时重新构建。"""
+    monkeypatch.setenv("NEXUS_TEST_DB_HOST", "env.db")
+    mock_provider.get_config.return_value = '{"host": "${NEXUS_TEST_DB_HOST}", "port": 5432}'
+    manager.register(DecoratedConfig)
+    original = manager.get_config(DecoratedConfig)
+    assert original.host == "env.db"
+
+    assert manager.reload_config(DecoratedConfig) is original
+
+    monkeypatch.setenv("NEXUS_TEST_DB_HOST", "other.db")
+    reloaded = manager.reload_config(DecoratedConfig)
+    assert reloaded is not original
+    assert reloaded.host == "other.db"
+
+
+def test_env_substitution_skips_undeclared_keys(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试环境变量替换只遍历配置类声明的顶层键。"""
+    mock_provider.get_config.return_value = (
+        '{"host": "${NEXUS_TEST_DB_HOST:-env.db}", "port": 5432, "unused": {"nested": "$HOME"}}'
+    )
+    with patch(
+        'yai_nexus_configuration.manager.recursive_replace_env_vars',
+        side_effect=lambda data: data
+    ) as mock_replace:
+        manager.register(DecoratedConfig)
+
+    mock_replace.assert_called_once()
+    assert set(mock_replace.call_args.args[0]) == {"host", "port"}
+
+
+def test_env_substitution_keeps_undeclared_keys_for_before_validators(
+    manager: NexusConfigManager, mock_provider: MagicMock, monkeypatch
+):
+    """测试未声明的顶层键仍会交给验证器，迁移旧键名的 before 验证器不受内容中 `$` 的影响。"""
+
+    @nexus_config(data_id="legacy.json", group="test")
+    class LegacyConfig(NexusConfig):
+        host: str
+
+        @model_validator(mode='before')
+        @classmethod
+        def migrate_db_host(cls, data):
+            if isinstance(data, dict) and 'db_host' in data:
+                data = {**data, 'host': data['db_host']}
+            return data
+
+    monkeypatch.setenv("NEXUS_TEST_LEGACY_HOST", "env.db")
+    mock_provider.get_config.return_value = '{"db_host": "${NEXUS_TEST_LEGACY_HOST}", "note": "costs $5"}'
+    manager.register(LegacyConfig)
+
+    assert manager.get_config(LegacyConfig).host == "env.db"
+
+
+def test_per_class_caches_do_not_keep_config_classes_alive():
+    """测试按配置类缓存的元数据和声明键不会阻止动态创建的配置类被回收。"""
+
+    @nexus_config(data_id="tenant.json", group="test")
+    class TenantConfig(NexusConfig):
+        name: str
+
+    assert get_config_metadata(TenantConfig)['data_id'] == "tenant.json"
+    assert _declared_input_keys(TenantConfig) == frozenset({"name"})
+    class_ref = weakref.ref(TenantConfig)
+
+    del TenantConfig
+    gc.collect()
+
+    assert class_ref() is None
+
+
+def test_trust_reload_skips_validation_on_reload(mock_provider: MagicMock):
+    """测试 trust_reload=True 时首次注册仍做验证，重新加载则跳过验证。"""
+    with patch.object(AbstractProvider, 'connect'):
+        manager = NexusConfigManager(provider=mock_provider, trust_reload=True)
+
+    mock_provider.get_config.return_value = '{"host": "test.db", "port": "invalid"}'
+    with pytest.raises(ConfigValidationError):
+        manager.register(DecoratedConfig)
+
+    mock_provider.get_config.return_value = '{"host": "test.db", "port": 5432}'
+    manager.register(DecoratedConfig)
+
+    mock_provider.get_config.return_value = '{"host": "new.db", "port": "1234"}'
+    reloaded = manager.reload_config(DecoratedConfig)
+
+    # 跳过验证时不做类型转换
+    assert reloaded.host == "new.db"
+    assert reloaded.port == "1234"
+
+
 def test_reload_unregistered_config_fails(manager: NexusConfigManager):
     """测试对一个未注册的配置调用 reload_config 会引发异常。"""
     with pytest.raises(ConfigNotRegisteredError):
         manager.reload_config(DecoratedConfig)
+    # 未注册的配置类走无锁快速路径，不会为其创建锁
+    assert DecoratedConfig not in manager._class_locks
 
 
 def test_config_change_callback_updates_store(manager: NexusConfigManager, mock_provider: MagicMock):
@@ -217,6 +416,52 @@ def test_config_change_callback_updates_store(manager: NexusConfigManager, mock_
     assert updated_config.port == 5678
 
 
+def test_config_change_callback_does_not_keep_manager_alive(mock_provider: MagicMock):
+    """测试注册到 Provider 的回调只弱引用管理器，管理器被回收后回调不再生效。"""
+    manager = NexusConfigManager(mock_provider)
+    manager.register(DecoratedConfig)
+    callback = mock_provider.watch_config.call_args.args[2]
+    manager_ref = weakref.ref(manager)
+
+    del manager
+    gc.collect()
+
+    assert manager_ref() is None
+    callback('{"host": "new.db", "port": 5433}')
+
+
+def test_wait_for_change(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试 wait_for_change 在配置变更时返回 True，无变更时超时返回 False。"""
+    manager.register(DecoratedConfig)
+    captured_callback = mock_provider.watch_config.call_args[0][2]
+
+    assert manager.wait_for_change(timeout=0) is False
+
+    captured_callback('{"host": "updated.db", "port": 5678}')
+    assert manager.wait_for_change(timeout=1.0) is True
+    # 事件已被重置
+    assert manager.wait_for_change(timeout=0) is False
+
+    # 内容未变化的回调不会触发变更通知
+    captured_callback('{"host": "updated.db", "port": 5678}')
+    assert manager.wait_for_change(timeout=0) is False
+
+
+def test_close_wakes_wait_for_change(manager: NexusConfigManager):
+    """测试 close 会唤醒阻塞在 wait_for_change 中的线程，关闭后的调用立即返回 False。"""
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(manager.wait_for_change()), daemon=True)
+    waiter.start()
+    time.sleep(0.05)
+
+    manager.close()
+    waiter.join(timeout=2.0)
+
+    assert not waiter.is_alive()
+    assert results == [False]
+    assert manager.wait_for_change() is False
+
+
 def test_register_with_invalid_json_content(mock_provider):
     """测试当配置文件内容为非法 JSON 时，register 方法会失败。"""
     
@@ -298,4 +543,27 @@ def test_close_manager(mock_provider):
     
     # 验证 close 之后，再次调用无副作用
     manager.close()
-    mock_provider.disconnect.assert_called_once() # disconnect 不应被再次调用 
\ No newline at end of file
+    mock_provider.disconnect.assert_called_once() # disconnect 不应被再次调用 
+
+def test_close_and_unregister_concurrently_do_not_deadlock(manager: NexusConfigManager, mock_provider: MagicMock):
+    """测试 close 与 unregister 并发执行时加锁顺序一致，不会互相等待。"""
+    manager.register(DecoratedConfig)
+    unwatch_started = threading.Event()
+
+    def slow_unwatch(data_id, group):
+        unwatch_started.set()
+        time.sleep(0.2)
+
+    mock_provider.unwatch_config.side_effect = slow_unwatch
+
+    unregister_thread = threading.Thread(target=manager.unregister, args=(DecoratedConfig,), daemon=True)
+    unregister_thread.start()
+    assert unwatch_started.wait(timeout=1.0)
+    close_thread = threading.Thread(target=manager.close, daemon=True)
+    close_thread.start()
+
+    unregister_thread.join(timeout=3.0)
+    close_thread.join(timeout=3.0)
+    assert not unregister_thread.is_alive()
+    assert not close_thread.is_alive()
+    assert manager._closed
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YAI Nexus Configuration - 单元测试 - Nacos Provider
+
+使用模拟的 nacos SDK 测试 NacosProvider 的客户端管理逻辑，无需真实的 Nacos 服务器。
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from yai_nexus_configuration.internal.providers import nacos as nacos_module
+from yai_nexus_configuration.internal.providers import NacosProvider
+
+
+@pytest.fixture
+def mock_nacos() -> MagicMock:
+    """提供一个模拟的 nacos 模块，每次创建客户端都返回新的模拟对象。"""
+    module = MagicMock()
+    module.NacosClient.side_effect = lambda **kwargs: MagicMock()
+    with patch.object(nacos_module, "_import_nacos", return_value=module):
+        yield module
+    nacos_module._CLIENT_POOL.clear()
+
+
+def test_providers_with_same_server_share_client(mock_nacos: MagicMock):
+    """测试连接参数相同的 Provider 共用同一个客户端，全部断开后才从池中移除。"""
+    first = NacosProvider("localhost:8848", namespace="dev")
+    second = NacosProvider("localhost:8848", namespace="dev")
+    other = NacosProvider("localhost:8848", namespace="prod")
+    for provider in (first, second, other):
+        provider.connect()
+
+    assert first._client is second._client
+    assert other._client is not first._client
+    assert mock_nacos.NacosClient.call_count == 2
+
+    first.disconnect()
+    assert len(nacos_module._CLIENT_POOL) == 2
+    second.disconnect()
+    other.disconnect()
+    assert nacos_module._CLIENT_POOL == {}
+
+
+def test_disconnect_removes_own_watchers_from_shared_client(mock_nacos: MagicMock):
+    """测试断开连接时只移除本 Provider 注册到共享客户端上的监听器。"""
+    first = NacosProvider("localhost:8848")
+    second = NacosProvider("localhost:8848")
+    first.connect()
+    second.connect()
+    client = first._client
+
+    first.watch_config("app.json", "DEFAULT_GROUP", lambda content: None)
+    callback = first._watchers[("DEFAULT_GROUP", "app.json")]
+    first.disconnect()
+
+    client.remove_config_watcher.assert_called_once_with("app.json", "DEFAULT_GROUP", cb=callback)
+    assert second._client is client
+    second.disconnect()
+
+
+def test_get_configs_fetches_all_items(mock_nacos: MagicMock):
+    """测试批量获取返回每个 (data_id, group) 对应的配置内容。"""
+    provider = NacosProvider("localhost:8848")
+    provider.connect()
+    provider._client.get_config.side_effect = lambda data_id, group: f"{group}/{data_id}"
+
+    items = [("app.json", "DEFAULT_GROUP"), ("db.yaml", "PROD"), ("cache.json", "PROD")]
+    assert provider.get_configs(items) == {item: f"{item[1]}/{item[0]}" for item in items}
+    provider.disconnect()
@@ -9,6 +9,8 @@ YAI Nexus Configuration - 单元测试 - 配置存储
 
 import pytest
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import ValidationError, model_validator
 
 from yai_nexus_configuration.internal.store import ConfigStore
 from yai_nexus_configuration.exceptions import ConfigNotRegisteredError
@@ -21,6 +23,13 @@ class ConfigA(NexusConfig):
 class ConfigB(NexusConfig):
     value: int
 
+# 并发测试使用的配置类，定义在模块级别，避免每次运行测试都重新创建 Pydantic 模型
+class ConcurrentConfigA(NexusConfig):
+    val: int
+
+class ConcurrentConfigB(NexusConfig):
+    val: int
+
 
 @pytest.fixture
 def store() -> ConfigStore:
@@ -28,20 +37,41 @@ def store() -> ConfigStore:
     return ConfigStore()
 
 
-def test_set_and_get_config(store: ConfigStore):
-    """测试设置和获取单个配置实例。"""
-    instance_a = ConfigA(name="test_a")
-    store.set_config(instance_a)
-
-    retrieved_a = store.get_config(ConfigA)
-    assert retrieved_a is instance_a
-    assert store.get_config_count() == 1
-
-
-def test_get_non_existent_config_fails(store: ConfigStore):
-    """测试获取一个不存在的配置会引发异常。"""
-    with pytest.raises(ConfigNotRegisteredError):
-        store.get_config(ConfigA)
+@pytest.mark.parametrize(
+    "ops, expected_name",
+    [
+        pytest.param([("set", "test_a")], "test_a", id="set_and_get"),
+        pytest.param([("set", "original"), ("set", "new")], "new", id="overwrite"),
+        pytest.param([("set", "test_a"), ("remove", True)], None, id="remove"),
+        pytest.param([("remove", False)], None, id="remove_non_existent"),
+        pytest.param([], None, id="get_non_existent"),
+    ],
+)
+def test_single_config_operations(store: ConfigStore, ops, expected_name):
+    """
+    测试单个配置类的设置、覆盖和移除。
+
+    ops 中的 ("set", name) 存储一个新的 ConfigA 实例，("remove", 预期返回值) 移除 ConfigA；
+    expected_name 为 None 表示最终不应存在 ConfigA。
+    """
+    last_instance = None
+    for op, arg in ops:
+        if op == "set":
+            last_instance = ConfigA(name=arg)
+            store.set_config(last_instance)
+        else:
+            assert store.remove_config(ConfigA) is arg
+
+    if expected_name is None:
+        assert store.get_config_count() == 0
+        assert ConfigA not in store
+        with pytest.raises(ConfigNotRegisteredError):
+            store.get_config(ConfigA)
+    else:
+        assert store.get_config_count() == 1
+        assert ConfigA in store
+        assert store.get_config(ConfigA) is last_instance
+        assert store.get_config(ConfigA).name == expected_name
 
 
 def test_set_multiple_configs(store: ConfigStore):
@@ -53,43 +83,11 @@ def test_set_multiple_configs(store: ConfigStore):
     store.set_config(instance_b)
 
     assert store.get_config_count() == 2
+    assert len(store) == 2
     assert store.get_config(ConfigA) is instance_a
     assert store.get_config(ConfigB) is instance_b
 
 
-def test_overwrite_config(store: ConfigStore):
-    """测试用一个新的实例覆盖一个已存在的配置。"""
-    original_instance = ConfigA(name="original")
-    store.set_config(original_instance)
-
-    new_instance = ConfigA(name="new")
-    store.set_config(new_instance)
-
-    assert store.get_config_count() == 1
-    assert store.get_config(ConfigA) is new_instance
-    assert store.get_config(ConfigA).name == "new"
-
-
-def test_remove_config(store: ConfigStore):
-    """测试移除一个已存在的配置。"""
-    instance_a = ConfigA(name="test_a")
-    store.set_config(instance_a)
-    assert store.get_config_count() == 1
-
-    removed = store.remove_config(ConfigA)
-    assert removed is True
-    assert store.get_config_count() == 0
-
-    with pytest.raises(ConfigNotRegisteredError):
-        store.get_config(ConfigA)
-
-
-def test_remove_non_existent_config(store: ConfigStore):
-    """测试移除一个不存在的配置会返回 False。"""
-    removed = store.remove_config(ConfigA)
-    assert removed is False
-
-
 def test_get_all_configs(store: ConfigStore):
     """测试 get_all_configs 方法能返回所有配置的字典。"""
     instance_a = ConfigA(name="test_a")
@@ -103,6 +101,14 @@ def test_get_all_configs(store: ConfigStore):
     assert all_configs[ConfigA.__name__] is instance_a
     assert all_configs[ConfigB.__name__] is instance_b
 
+    # 配置未变化时复用同一个只读视图，写入后重新构建
+    assert store.get_all_configs() is all_configs
+    with pytest.raises(TypeError):
+        all_configs["ConfigC"] = instance_a
+    store.remove_config(ConfigA)
+    assert ConfigA.__name__ not in store.get_all_configs()
+    assert ConfigA.__name__ in all_configs
+
 
 def test_clear_store(store: ConfigStore):
     """测试 clear 方法能移除所有配置。"""
@@ -118,40 +124,41 @@ def test_clear_store(store: ConfigStore):
 def test_concurrent_access_to_store():
     """测试 ConfigStore 在多线程环境下的线程安全。"""
     store = ConfigStore()
-    
-    class ConfigA(NexusConfig):
-        val: int
-    
-    class ConfigB(NexusConfig):
-        val: int
 
     num_threads = 10
     iterations = 100
+    # 所有工作线程就绪后同时开始，避免先启动的线程在其他线程启动前就已结束
+    barrier = threading.Barrier(num_threads)
     
     def worker(config_class, start_val):
-        for i in range(iterations):
-            instance = config_class(val=start_val + i)
+        # 预先构建实例，让并发阶段只包含存储的读写，而不是 Pydantic 验证
+        instances = [config_class(val=start_val + i) for i in range(iterations)]
+        barrier.wait(timeout=5)
+        # 循环内只记录读到的最小值，结束后统一断言
+        min_seen = float("inf")
+        for instance in instances:
             store.set_config(instance)
-            retrieved = store.get_config(config_class)
-            assert retrieved.val >= start_val
+            min_seen = min(min_seen, store.get_config(config_class).val)
+        assert min_seen >= start_val
 
-    threads = []
-    for i in range(num_threads):
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
         # 交替读写不同的配置类
-        config_class = ConfigA if i % 2 == 0 else ConfigB
-        thread = threading.Thread(target=worker, args=(config_class, i * iterations))
-        threads.append(thread)
-        thread.start()
-
-    for thread in threads:
-        thread.join()
+        futures = [
+            executor.submit(
+                worker, ConcurrentConfigA if i % 2 == 0 else ConcurrentConfigB, i * iterations
+            )
+            for i in range(num_threads)
+        ]
+        # result() 会重新抛出工作线程中的断言失败
+        for future in futures:
+            future.result()
 
     # 验证最终状态
     assert store.get_config_count() == 2
-    final_a = store.get_config(ConfigA)
-    final_b = store.get_config(ConfigB)
-    assert isinstance(final_a, ConfigA)
-    assert isinstance(final_b, ConfigB)
+    final_a = store.get_config(ConcurrentConfigA)
+    final_b = store.get_config(ConcurrentConfigB)
+    assert isinstance(final_a, ConcurrentConfigA)
+    assert isinstance(final_b, ConcurrentConfigB)
 
 
 def test_set_config_with_invalid_type():
@@ -162,4 +169,61 @@ def test_set_config_with_invalid_type():
         pass
     
     with pytest.raises(TypeError, match="只能存储 NexusConfig 的子类实例"):
-        store.set_config(NotAConfig()) 
\ No newline at end of file
+        store.set_config(NotAConfig()) 
+
+def test_update_config_field(store: ConfigStore):
+    """测试更新单个字段会生成新实例并验证新值，原实例保持不变。"""
+    original = ConfigB(value=1)
+    store.set_config(original)
+
+    updated = store.update_config_field(ConfigB, "value", "42")
+
+    assert updated.value == 42
+    assert store.get_config(ConfigB) is updated
+    assert original.value == 1
+
+    with pytest.raises(ValidationError):
+        store.update_config_field(ConfigB, "value", "not-an-int")
+    assert store.get_config(ConfigB) is updated
+
+
+class _ReentryDetectingLock:
+    """包装 threading.Lock：同一线程重复获取时立即失败，而不是死锁"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._owner = None
+
+    def __enter__(self):
+        assert self._owner != threading.get_ident(), "同一线程重复获取了配置类的锁"
+        self._lock.acquire()
+        self._owner = threading.get_ident()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._owner = None
+        self._lock.release()
+
+
+def test_writes_never_reenter_class_lock():
+    """测试写操作持有配置类的锁期间不会再次获取同一把锁（该锁不可重入）。"""
+    store = ConfigStore()
+
+    class ValidatedConfig(NexusConfig, extra='allow'):
+        value: int
+
+        @model_validator(mode='after')
+        def read_store(self):
+            # 验证器在持锁期间执行，其中的读操作不能再获取锁
+            if ValidatedConfig in store:
+                store.get_config(ValidatedConfig)
+            return self
+
+    # 发生重入时真实的 threading.Lock 会死锁，替换为检测重入的锁使测试失败而不是挂起
+    store._locks[ValidatedConfig] = _ReentryDetectingLock()
+
+    store.set_config(ValidatedConfig(value=1))
+    assert store.update_config_field(ValidatedConfig, "value", 2).value == 2
+    assert store.update_config_field(ValidatedConfig, "note", "undeclared").note == "undeclared"
+    assert store.remove_config(ValidatedConfig) is True
+    assert ValidatedConfig not in store
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YAI Nexus Configuration - 单元测试 - 工具函数
+
+测试环境变量替换等内部工具函数。
+"""
+
+import pytest
+
+from yai_nexus_configuration.internal.utils import recursive_replace_env_vars
+
+
+@pytest.fixture(autouse=True)
+def env_vars(monkeypatch):
+    """设置测试用的环境变量。"""
+    monkeypatch.setenv("DB_HOST", "db.example.com")
+    monkeypatch.setenv("DB_PORT", "5432")
+    monkeypatch.delenv("UNDEFINED_VAR", raising=False)
+
+
+def test_replace_env_vars_in_nested_structure():
+    """测试嵌套的字典和列表中的占位符都会被替换，其他类型原样保留。"""
+    config = {
+        "url": "postgres://${DB_HOST}:$DB_PORT/app",
+        "replicas": [{"host": "$DB_HOST"}, ["${DB_PORT}", 1, None]],
+        "enabled": True,
+    }
+
+    assert recursive_replace_env_vars(config) == {
+        "url": "postgres://db.example.com:5432/app",
+        "replicas": [{"host": "db.example.com"}, ["5432", 1, None]],
+        "enabled": True,
+    }
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("no placeholders", "no placeholders"),
+    ("${UNDEFINED_VAR}", "${UNDEFINED_VAR}"),
+    ("$UNDEFINED_VAR", "$UNDEFINED_VAR"),
+    ("$$DB_HOST", "$DB_HOST"),
+    ("price: $5", "price: $5"),
+    ("${DB_HOST", "${DB_HOST"),
+    ("${DB_HOST:-localhost}", "db.example.com"),
+    ("${UNDEFINED_VAR:-localhost}", "localhost"),
+    ("${UNDEFINED_VAR:-}", ""),
+])
+def test_replace_env_vars_edge_cases(value, expected):
+    """测试未定义变量、默认值、转义和不合法占位符的处理。"""
+    assert recursive_replace_env_vars(value) == expected
+
+
+def test_replace_env_vars_handles_deep_nesting():
+    """测试深度嵌套的配置不会触及递归深度限制。"""
+    config = current = {}
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+    current["host"] = "$DB_HOST"
+
+    result = recursive_replace_env_vars(config)
+    for _ in range(5000):
+        result = result["child"]
+    assert result == {"host": "db.example.com"}